@@ -1,4 +1,33 @@
-from .cli import thunter_cli_app
-from .cli import main
+import sys
 
 __all__ = ["thunter_cli_app", "main"]
+
+
+def get_version() -> str:
+    """Installed version of thunter, read from the package metadata."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("thunter")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main():
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        # Nothing to dispatch, answer before Typer is even imported
+        print(f"thunter {get_version()}")
+        return
+
+    from .cli import main
+
+    main()
+
+
+def __getattr__(name):
+    # Typer is slow to import, so the app is only built once it's needed
+    if name == "thunter_cli_app":
+        from .cli import thunter_cli_app
+
+        return thunter_cli_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
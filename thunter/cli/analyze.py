@@ -1,5 +1,4 @@
 import typer
-from IPython import embed
 
 from thunter.constants import Status
 from thunter.analyzer import TaskAnalyzer
@@ -25,4 +24,7 @@ def analyze():
 
     # TODO: time series plot of estimate vs actual
 
+    # IPython is slow to import and only needed once the data is loaded
+    from IPython import embed
+
     embed()
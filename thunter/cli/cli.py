@@ -1,45 +1,64 @@
+import importlib
 import re
 import sys
-from typing_extensions import Annotated
+from typing import Annotated
 
 import typer.core
-from rich.console import Console
 
 from thunter import settings
-from thunter.cli.create import app as create_app
-from thunter.cli.db import app as db_app
-from thunter.cli.edit import app as edit_app
-from thunter.cli.estimate import app as estimate_app
-from thunter.cli.finish import app as finish_app
-from thunter.cli.init import app as init_app, init
-from thunter.cli.ls import app as ls_app
-from thunter.cli.restart import app as restart_app
-from thunter.cli.rm import app as rm_app
-from thunter.cli.show import app as show_app
-from thunter.cli.stop import app as stop_app
-from thunter.cli.workon import app as workon_app
+from thunter.cli import get_version
+from thunter.cli.init import init
 from thunter.constants import ThunterError
 
+# Subcommands by their registered name (with aliases), mapped to the module
+# defining their Typer app. A module is only imported once its command is
+# looked up, so running one command doesn't load all the others.
+LAZY_COMMANDS = {
+    "init": "thunter.cli.init",
+    "ls, list": "thunter.cli.ls",
+    "show": "thunter.cli.show",
+    "w, workon": "thunter.cli.workon",
+    "create": "thunter.cli.create",
+    "restart": "thunter.cli.restart",
+    "stop": "thunter.cli.stop",
+    "f, finish": "thunter.cli.finish",
+    "estimate": "thunter.cli.estimate",
+    "edit": "thunter.cli.edit",
+    "rm, remove": "thunter.cli.rm",
+    "db": "thunter.cli.db",
+}
+# Every name a subcommand can be called by, mapped to its registered name
+COMMAND_ALIASES = {
+    alias: name for name in LAZY_COMMANDS for alias in re.split(r" ?[,|] ?", name)
+}
+
+
+def version_callback(value: bool):
+    if value:
+        typer.echo(f"thunter {get_version()}")
+        raise typer.Exit()
+
 
 class AliasGroup(typer.core.TyperGroup):
-    """Custom override of TyperGroup to support command aliases.
+    """Custom override of TyperGroup to support command aliases and lazily
+    loading the subcommands listed in LAZY_COMMANDS.
 
     Watch this issue for possible native support in Typer for aliases:
     https://github.com/fastapi/typer/issues/1242
     """
 
-    _CMD_SPLIT_P = re.compile(r" ?[,|] ?")
+    def list_commands(self, ctx):
+        return list(LAZY_COMMANDS)
 
     def get_command(self, ctx, cmd_name):
         cmd_name = self._group_cmd_name(cmd_name)
+        if cmd_name not in self.commands and cmd_name in LAZY_COMMANDS:
+            module = importlib.import_module(LAZY_COMMANDS[cmd_name])
+            self.add_command(typer.main.get_command(module.app), cmd_name)
         return super().get_command(ctx, cmd_name)
 
     def _group_cmd_name(self, default_name):
-        for cmd in self.commands.values():
-            name = cmd.name
-            if name and default_name in self._CMD_SPLIT_P.split(name):
-                return name
-        return default_name
+        return COMMAND_ALIASES.get(default_name, default_name)
 
 
 thunter_cli_app = typer.Typer(
@@ -47,19 +66,7 @@ thunter_cli_app = typer.Typer(
     no_args_is_help=True,
     cls=AliasGroup,
 )
-# Add all subcommands to the main CLI app
-thunter_cli_app.add_typer(init_app)
-thunter_cli_app.add_typer(ls_app)
-thunter_cli_app.add_typer(show_app)
-thunter_cli_app.add_typer(workon_app)
-thunter_cli_app.add_typer(create_app)
-thunter_cli_app.add_typer(restart_app)
-thunter_cli_app.add_typer(stop_app)
-thunter_cli_app.add_typer(finish_app)
-thunter_cli_app.add_typer(estimate_app)
-thunter_cli_app.add_typer(edit_app)
-thunter_cli_app.add_typer(rm_app)
-thunter_cli_app.add_typer(db_app)
+# Subcommands are added on demand by AliasGroup, see LAZY_COMMANDS
 
 
 @thunter_cli_app.callback()
@@ -82,10 +89,23 @@ def main_callback(
             help="Run thunter in debug mode, printing out full exceptions and traces.",
         ),
     ] = False,
+    version: Annotated[
+        bool,
+        typer.Option(
+            "--version",
+            "-v",
+            help="Show the thunter version and exit.",
+            callback=version_callback,
+            is_eager=True,
+        ),
+    ] = False,
 ):
     """THunter - your task hunter, tracking time spent on your TODO list!"""
     settings.print_config["silent"] = silent or settings.THUNTER_SILENT
     settings.print_config["debug"] = debug or settings.DEBUG
+    if ctx.resilient_parsing:
+        # shell completion, don't touch the database
+        return
     if ctx.invoked_subcommand != "init" and settings.needs_init():
         ctx.invoke(init)
 
@@ -96,7 +116,7 @@ def main():
     except KeyboardInterrupt:
         sys.exit(1)
     except ThunterError as thunter_error:
-        console = Console()
+        console = settings.get_console()
         if settings.print_config["debug"]:
             console.print_exception(show_locals=True)
         console.print(str(thunter_error))
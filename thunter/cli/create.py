@@ -1,8 +1,7 @@
 from typing import Annotated
 import typer
 
-from thunter.cli.show import show
-from thunter.task_hunter import TaskHunter
+from thunter.settings import thunter_print
 
 
 app = typer.Typer()
@@ -10,7 +9,6 @@ app = typer.Typer()
 
 @app.command()
 def create(
-    ctx: typer.Context,
     task_id: Annotated[list[str], typer.Argument()],
     estimate: Annotated[
         int | None,
@@ -27,10 +25,14 @@ def create(
     ] = None,
 ):
     """Create a new task."""
+    from thunter.parser import display_task
+    from thunter.task_hunter import TaskHunter
+
     hunter = TaskHunter()
     new_task = hunter.create_task(
         name=" ".join(task_id),
         estimate=estimate,
         description=description,
     )
-    ctx.invoke(show, task_id=str(new_task.id))
+    # a brand new task has no history to look up
+    thunter_print(display_task(task=new_task, task_history=[]))
@@ -1,4 +1,3 @@
-from subprocess import call
 import typer
 
 from thunter.settings import DATABASE
@@ -15,4 +14,6 @@ def db():
 
     sqlite3> SELECT * FROM history WHERE taskid = 1 ORDER BY time DESC
     """
+    from subprocess import call
+
     call(["sqlite3", DATABASE])
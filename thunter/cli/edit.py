@@ -1,14 +1,10 @@
-from subprocess import call
-import tempfile
 from typing import Annotated
 import typer
 
-from thunter.cli.ls import ls
+from thunter.cli.ls import display_tasks
 from thunter import settings
 from thunter.constants import Status
 from thunter.settings import thunter_print
-from thunter.task_hunter import TaskHunter
-from thunter.parser import parse_task_display
 
 
 app = typer.Typer()
@@ -16,7 +12,6 @@ app = typer.Typer()
 
 @app.command()
 def edit(
-    ctx: typer.Context,
     task_identifier: Annotated[
         str | None,
         typer.Argument(
@@ -26,6 +21,12 @@ def edit(
     ] = None,
 ):
     """Edit a task. Use with caution."""
+    from subprocess import call
+    import tempfile
+
+    from thunter.parser import parse_task_display
+    from thunter.task_hunter import TaskHunter
+
     hunter = TaskHunter()
     if task_identifier and task_identifier.isdigit():
         task = hunter.get_task(task_identifier)
@@ -40,28 +41,29 @@ def edit(
         return
 
     with tempfile.NamedTemporaryFile(mode="w", suffix=".tmp") as tf:
-        tf.write(hunter.display_task(task.id))
+        tf.write(hunter.display_task(task))
         tf.flush()
-        call(settings.EDITOR.split(" ") + [tf.name])
+        call([*settings.EDITOR_ARGV, tf.name])
 
+        # reopen by name, editors may replace the file rather than write to it
         with open(tf.name, mode="r") as tf:
-            tf.seek(0)
             updated_task_to_parse = tf.read()
 
     parsed_task_data = parse_task_display(updated_task_to_parse)
-    hunter.remove_task(task.id)
-    new_updated_task = hunter.create_task(
-        name=parsed_task_data.name,
-        estimate=parsed_task_data.estimate,
-        description=parsed_task_data.description,
-        status=parsed_task_data.status,
-        created_at=task.created_at,
-    )
-    for history_data in parsed_task_data.history:
-        hunter.insert_history(
-            taskid=new_updated_task.id,
-            is_start=history_data.is_start,
-            time=history_data.time,
+    with hunter.transaction():
+        hunter.update_task(
+            task.id,
+            name=parsed_task_data.name,
+            estimate=parsed_task_data.estimate,
+            description=parsed_task_data.description,
+            status=parsed_task_data.status,
+        )
+        hunter.replace_history(
+            task.id,
+            [
+                (history_data.is_start, history_data.time)
+                for history_data in parsed_task_data.history
+            ],
         )
 
-    ctx.invoke(ls, starts_with=new_updated_task.name, all=True)
+    display_tasks(hunter, set(Status), starts_with=parsed_task_data.name)
@@ -1,9 +1,9 @@
+from dataclasses import replace
 from typing import Annotated
 import typer
 
 from thunter.constants import ThunterCouldNotFindTaskError
 from thunter.settings import thunter_print
-from thunter.task_hunter import TaskHunter
 
 
 app = typer.Typer()
@@ -23,6 +23,8 @@ def estimate(
     ] = None,
 ):
     """Estimate how long a task will take."""
+    from thunter.task_hunter import TaskHunter
+
     hunter = TaskHunter()
     if task_identifier:
         task = hunter.get_task(task_identifier)
@@ -35,7 +37,7 @@ def estimate(
         )
 
     hunter.estimate_task(task.id, estimate)
-    task = hunter.get_task(task.id)
+    task = replace(task, estimate=estimate)
     thunter_print(
         f"[green]{task.name}[/green] estimated to take [yellow]{task.estimate_display}[/yellow]."
     )
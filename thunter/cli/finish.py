@@ -1,9 +1,7 @@
 from typing import Annotated
 import typer
 
-from thunter.constants import Status
 from thunter.settings import thunter_print
-from thunter.task_hunter import TaskHunter
 
 
 app = typer.Typer()
@@ -12,10 +10,10 @@ app = typer.Typer()
 @app.command("f, finish")
 def finish(task_id: Annotated[str | None, typer.Argument()] = None):
     """Finish a task (defaults to finish current task)."""
+    from thunter.task_hunter import TaskHunter
+
     hunter = TaskHunter()
     task = hunter.get_task(task_id)
-    if task.status == Status.CURRENT:
-        hunter.stop_current_task()
-
+    # also stops the task if it's the current one
     hunter.finish_task(task.id)
     thunter_print(f"Finished [green]{task.name}[/green]!")
@@ -5,8 +5,7 @@ from typing import Annotated
 import typer
 
 from thunter import settings
-from thunter.db import Database
-from thunter.settings import thunter_print, needs_init
+from thunter.settings import confirm, thunter_print, needs_init
 
 app = typer.Typer()
 
@@ -25,7 +24,7 @@ def init(
     thunter_print("Initializing THunter...")
     if not needs_init():
         prompt = "WARNING: Are you sure you want to re-initialize? You will lose all tasks and tracking info [yN]"
-        user_sure = force or input(prompt).lower() == "y"
+        user_sure = force or confirm(prompt)
         if not user_sure:
             thunter_print("Aborting re-initialization")
             raise typer.Exit()
@@ -37,6 +36,8 @@ def init(
         os.mkdir(settings.THUNTER_DIR)
 
     thunter_print(f"Creating sqlite database {settings.DATABASE}")
+    from thunter.db import Database
+
     db = Database()
     db.init_db()
 
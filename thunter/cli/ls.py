@@ -1,18 +1,28 @@
-from collections import defaultdict
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich import box
-from rich.table import Table
 
 from thunter.constants import Status
 from thunter.models.task_history_record import TaskHistoryRecord
 from thunter.settings import thunter_print
-from thunter.task_hunter import TaskHunter
+
+if TYPE_CHECKING:
+    from thunter.task_hunter import TaskHunter
 
 
 app = typer.Typer()
 
+ALL_STATUSES = frozenset(Status)
+OPEN_STATUSES = frozenset([Status.CURRENT, Status.IN_PROGRESS, Status.TODO])
+STARTED_STATUSES = frozenset([Status.CURRENT, Status.IN_PROGRESS])
+
+# Row colors in the task table, TODO tasks use the default style
+STATUS_STYLES = {
+    Status.CURRENT: "yellow",
+    Status.IN_PROGRESS: "orange3",
+    Status.FINISHED: "green",
+}
+
 
 @app.command("ls, list")
 def ls(
@@ -101,11 +111,11 @@ def ls(
     """List tasks. Defaults to listing all open tasks (CURRENT, IN_PROGRESS, TODO)."""
     statuses: set[Status] = set()
     if all:
-        statuses.update(Status)
+        statuses |= ALL_STATUSES
     if open:
-        statuses.update([Status.CURRENT, Status.IN_PROGRESS, Status.TODO])
+        statuses |= OPEN_STATUSES
     if started:
-        statuses.update([Status.CURRENT, Status.IN_PROGRESS])
+        statuses |= STARTED_STATUSES
     if current:
         statuses.add(Status.CURRENT)
     if in_progress:
@@ -115,26 +125,32 @@ def ls(
     if finished:
         statuses.add(Status.FINISHED)
     if not statuses:
-        statuses.update([Status.CURRENT, Status.IN_PROGRESS, Status.TODO])
+        statuses |= OPEN_STATUSES
+
+    from thunter.task_hunter import TaskHunter
 
-    # Get the filtered and sorted list of tasks to display
-    hunter = TaskHunter()
-    tasks = hunter.get_tasks(
+    display_tasks(TaskHunter(), statuses, starts_with=starts_with, contains=contains)
+
+
+def display_tasks(
+    hunter: "TaskHunter",
+    statuses: set[Status],
+    starts_with: str | None = None,
+    contains: str | None = None,
+) -> None:
+    """Print a table of the tasks matching the filters, with their progress."""
+    # Get the filtered and sorted list of tasks to display, with their
+    # progress calculated from history
+    tasks_with_progress = hunter.get_tasks_with_progress(
         statuses,
         starts_with=starts_with,
         contains=contains,
     )
 
-    # Calculate progress from history
-    history_records = hunter.get_history([task.id for task in tasks])
-    taskid2history = defaultdict(list)
-    for record in history_records:
-        taskid2history[record.taskid].append(record)
-    taskid2progress = defaultdict(int)
-    for taskid, task_history in taskid2history.items():
-        taskid2progress[taskid] = TaskHistoryRecord.calc_progress(task_history)
-
     # Pretty display in a table with colors
+    from rich import box
+    from rich.table import Table
+
     table = Table(
         "ID",
         "NAME",
@@ -143,20 +159,13 @@ def ls(
         "STATUS",
         box=box.MINIMAL_HEAVY_HEAD,
     )
-    for task in tasks:
+    for task, progress in tasks_with_progress:
         row = (
             str(task.id),
             task.name,
             task.estimate_display,
-            TaskHistoryRecord.display_progress(taskid2progress[task.id]),
+            TaskHistoryRecord.display_progress(progress),
             task.status.value,
         )
-        style = None
-        if task.status == Status.CURRENT:
-            style = "yellow"
-        elif task.status == Status.IN_PROGRESS:
-            style = "orange3"
-        elif task.status == Status.FINISHED:
-            style = "green"
-        table.add_row(*row, style=style)
+        table.add_row(*row, style=STATUS_STYLES.get(task.status))
     thunter_print(table)
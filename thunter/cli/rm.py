@@ -1,8 +1,7 @@
 from typing import Annotated
 import typer
 
-from thunter.settings import thunter_print
-from thunter.task_hunter import TaskHunter
+from thunter.settings import confirm, thunter_print
 
 
 app = typer.Typer()
@@ -18,6 +17,8 @@ def rm(
     ] = False,
 ):
     """Remove/delete a task."""
+    from thunter.task_hunter import TaskHunter
+
     hunter = TaskHunter()
     task_identifier = " ".join(task_id)
     task = hunter.get_task(task_identifier)
@@ -28,7 +29,7 @@ def rm(
         prompt = (
             f"Are you sure you want to permanently delete [red]{task.name}[/red]!? [yN]"
         )
-        user_is_sure = input(prompt).lower() == "y"
+        user_is_sure = confirm(prompt)
 
     if user_is_sure:
         hunter.remove_task(task.id)
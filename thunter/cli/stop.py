@@ -1,7 +1,6 @@
 import typer
 
 from thunter.settings import thunter_print
-from thunter.task_hunter import TaskHunter
 
 
 app = typer.Typer()
@@ -10,6 +9,8 @@ app = typer.Typer()
 @app.command()
 def stop():
     """Stop working on current task."""
+    from thunter.task_hunter import TaskHunter
+
     hunter = TaskHunter()
     stopped_task = hunter.stop_current_task()
     if not stopped_task:
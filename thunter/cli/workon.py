@@ -1,9 +1,8 @@
 from typing import Annotated
 import typer
 
-from thunter.cli.ls import ls
+from thunter.cli.ls import display_tasks
 from thunter.constants import Status, ThunterCouldNotFindTaskError
-from thunter.task_hunter import TaskHunter
 
 
 app = typer.Typer()
@@ -11,7 +10,6 @@ app = typer.Typer()
 
 @app.command("w, workon")
 def workon(
-    ctx: typer.Context,
     task_id: Annotated[list[str] | None, typer.Argument()] = None,
     create: Annotated[
         bool | None,
@@ -43,6 +41,8 @@ def workon(
     ] = None,
 ):
     """Start/continue working on an unfinished task."""
+    from thunter.task_hunter import TaskHunter
+
     hunter = TaskHunter()
     task_id_str = " ".join(task_id) if task_id else None
     try:
@@ -70,7 +70,7 @@ def workon(
             raise
 
     hunter.workon_task(task.id)
-    ctx.invoke(ls, current=True)
+    display_tasks(hunter, {Status.CURRENT})
 
 
 def get_estimate(estimate_hours: int | None) -> int:
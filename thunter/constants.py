@@ -6,7 +6,10 @@ class TableName(Enum):
     HISTORY = "history"
 
 
-class Status(Enum):
+class Status(str, Enum):
+    """Task statuses. Members are strings, so they can be bound as sqlite
+    parameters directly."""
+
     CURRENT = "Current"
     IN_PROGRESS = "In Progress"
     TODO = "TODO"
@@ -19,6 +22,9 @@ STATUS_ORDERING = [
     Status.TODO.value,
     Status.FINISHED.value,
 ]
+STATUS_RANK = {status: rank for rank, status in enumerate(STATUS_ORDERING)}
+# Same as Status(value), without going through Enum's lookup machinery
+STATUS_FROM_VALUE = {status.value: status for status in Status}
 
 TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
@@ -1,4 +1,7 @@
+from collections.abc import Sequence
 from contextlib import contextmanager
+from functools import lru_cache
+import weakref
 
 import sqlite3
 
@@ -13,68 +16,190 @@ class Database:
     """Base class for database interactions, supplying a context manager for
     database connections and handling initialization."""
 
+    # Connection tuning for a single local user: WAL journaling with NORMAL
+    # syncing avoids an fsync on every commit, while still being crash safe.
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=2000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-8000",
+        "PRAGMA foreign_keys=ON",
+    )
+
+    _INSERT_TASK_SQL = (
+        f"INSERT INTO {TableName.TASKS.value} "
+        "(name,estimate,description,status,last_modified_at,created_at) "
+        "VALUES (?,?,?,?,?,?)"
+    )
+    _INSERT_HISTORY_WITH_TIME_SQL = (
+        f"INSERT INTO {TableName.HISTORY.value} (taskid,is_start,time) VALUES (?,?,?)"
+    )
+
+    # One statement per updatable field, the field name can't be a parameter
+    _UPDATE_TASK_FIELD_SQL = {
+        field: f"UPDATE {TableName.TASKS.value} SET {field}=?, last_modified_at=? WHERE id=?"
+        for field in ("name", "estimate", "description", "status")
+    }
+
+    # Stored in the database's user_version. Bump it whenever SCHEMA_SQL
+    # changes, so databases created by older versions get brought up to date.
+    SCHEMA_VERSION = 2
+    # Tables, trigger and indexes, each created only if missing, in a single
+    # transaction. Ends by gathering index statistics for the query planner.
+    SCHEMA_SQL = f"""
+        BEGIN;
+        CREATE TABLE IF NOT EXISTS {TableName.TASKS.value} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            estimate INTEGER,
+            description TEXT,
+            status TEXT NOT NULL,
+            last_modified_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', current_timestamp) AS integer)),
+            created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', current_timestamp) AS integer))
+        );
+        CREATE TABLE IF NOT EXISTS {TableName.HISTORY.value} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            taskid INTEGER NOT NULL,
+            is_start BOOLEAN NOT NULL,
+            time INTEGER NOT NULL DEFAULT (CAST(strftime('%s', current_timestamp) AS integer)),
+            FOREIGN KEY (taskid) REFERENCES {TableName.TASKS.value}(id) ON DELETE CASCADE
+        );
+        CREATE TRIGGER IF NOT EXISTS last_modified_task_trigger
+        AFTER UPDATE ON {TableName.TASKS.value}
+        BEGIN
+            UPDATE {TableName.TASKS.value} SET last_modified_at =
+            (CAST(strftime('%s', current_timestamp) AS integer))
+            WHERE id = NEW.id;
+        END;
+        CREATE INDEX IF NOT EXISTS idx_tasks_status
+            ON {TableName.TASKS.value}(status, last_modified_at DESC);
+        -- at most one row, the current task
+        CREATE INDEX IF NOT EXISTS idx_tasks_current ON {TableName.TASKS.value}(status)
+            WHERE status = '{Status.CURRENT.value}';
+        CREATE INDEX IF NOT EXISTS idx_tasks_name ON {TableName.TASKS.value}(name);
+        -- LIKE is case insensitive, so prefix matches can only be looked up
+        -- in an index that ignores case as well
+        CREATE INDEX IF NOT EXISTS idx_tasks_name_nocase
+            ON {TableName.TASKS.value}(name COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_history_taskid
+            ON {TableName.HISTORY.value}(taskid, time);
+        ANALYZE;
+        PRAGMA user_version = {SCHEMA_VERSION};
+        COMMIT;
+    """
+
     def __init__(self, database=None):
         self.database = database or settings.DATABASE
+        self._conn: sqlite3.Connection | None = None
+        self._close_conn: weakref.finalize | None = None
+        # set for the duration of a transaction, see `now`
+        self._transaction_now: int | None = None
 
     def init_db(self):
         """Setup the database and tables. Does nothing if the database is already initialized."""
-        with self.connect() as con:
-            con.execute(
-                f"CREATE TABLE IF NOT EXISTS {TableName.TASKS.value} ("
-                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
-                "name TEXT NOT NULL, "
-                "estimate INTEGER, "
-                "description TEXT, "
-                "status TEXT NOT NULL, "
-                "last_modified_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', current_timestamp) AS integer)), "
-                "created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', current_timestamp) AS integer))"
-                ")"
-            )
-            con.execute(
-                f"CREATE TABLE IF NOT EXISTS {TableName.HISTORY.value} ("
-                "id INTEGER PRIMARY KEY AUTOINCREMENT,"
-                "taskid INTEGER NOT NULL,"
-                "is_start BOOLEAN NOT NULL,"
-                "time INTEGER NOT NULL DEFAULT (CAST(strftime('%s', current_timestamp) AS integer)),"
-                f"FOREIGN KEY (taskid) REFERENCES {TableName.TASKS.value}(id)"
-                ")"
-            )
-            con.execute(
-                "CREATE TRIGGER IF NOT EXISTS last_modified_task_trigger "
-                f"AFTER UPDATE ON {TableName.TASKS.value} "
-                "BEGIN"
-                f"  UPDATE {TableName.TASKS.value} SET last_modified_at = "
-                "  (CAST(strftime('%s', current_timestamp) AS integer)) "
-                "  WHERE id = NEW.id;"
-                "END;"
-            )
+        # connecting brings a new or older database's schema up to date
+        with self.connect():
+            pass
+
+    def _upgrade_schema(self, conn: sqlite3.Connection) -> None:
+        """Run SCHEMA_SQL, adding whatever tables, indexes etc. are missing."""
+        # executescript commits any open transaction before it runs, so the
+        # script manages its own
+        try:
+            conn.executescript(self.SCHEMA_SQL)
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """The connection shared by every query made through this instance.
+
+        Opened lazily and configured once, so a command issuing several
+        queries only pays the connection setup cost a single time."""
+        if self._conn is None:
+            # Autocommit mode, writes are grouped explicitly with `transaction`
+            self._conn = sqlite3.connect(self.database, isolation_level=None)
+            for pragma in self.PRAGMAS:
+                self._conn.execute(pragma)
+            # Closes the connection when this instance is garbage collected,
+            # or at the latest when the interpreter exits
+            self._close_conn = weakref.finalize(self, _close_connection, self._conn)
+            user_version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if user_version < self.SCHEMA_VERSION:
+                # create the schema in a new database, or add what's missing,
+                # like the indexes, to an older one
+                self._upgrade_schema(self._conn)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection, if one was opened."""
+        if self._close_conn is not None:
+            self._close_conn()
+            self._conn = None
+            self._close_conn = None
 
     @contextmanager
     def connect(self):
-        conn = sqlite3.connect(self.database)
-        yield conn
-        conn.commit()
-        conn.close()
+        yield self._connection
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements in a single transaction, committed on
+        success and rolled back on error. Nested transactions join the outer one."""
+        conn = self._connection
+        outermost = not conn.in_transaction
+        if outermost:
+            # Take the write lock up front (transactions are only used for
+            # writes), so a read followed by a write can't fail to upgrade
+            # its lock without waiting out busy_timeout
+            conn.execute("BEGIN IMMEDIATE")
+            self._transaction_now = now_sec()
+        try:
+            yield conn
+        except BaseException:
+            if outermost:
+                conn.execute("ROLLBACK")
+            raise
+        else:
+            if outermost:
+                conn.execute("COMMIT")
+        finally:
+            if outermost:
+                self._transaction_now = None
+
+    def now(self) -> int:
+        """The current time (seconds since epoch).
+
+        Fixed for the duration of a transaction, so everything written in it,
+        like the stop and start of switching tasks, shares one timestamp."""
+        if self._transaction_now is not None:
+            return self._transaction_now
+        return now_sec()
 
     def update_task_field(self, taskid: int, field: str, value: str | int) -> None:
         """Update a specific field of a task in the database."""
-        sql = ("UPDATE {table} SET {field}=?, last_modified_at=? WHERE id=?").format(
-            table=TableName.TASKS.value, field=field
-        )
-        sql_params = (value, now_sec(), taskid)
-        with self.connect() as conn:
-            conn.execute(sql, sql_params)
+        sql = self._UPDATE_TASK_FIELD_SQL.get(field)
+        if sql is None:
+            raise ValueError(f"Can not update task field: {field}")
+        with self.transaction() as conn:
+            conn.execute(sql, (value, self.now(), taskid))
 
     def select_from_task(
         self,
         where_clause: str | None = None,
         order_by: str | None = None,
-        params: list[str] | None = None,
+        params: Sequence[str | int] | None = None,
+        limit: int | None = None,
     ) -> list[Task]:
         return list(
             map(
                 Task.from_db_record,
-                self.select_from_table(TableName.TASKS, where_clause, order_by, params),
+                self.select_from_table(
+                    TableName.TASKS, where_clause, order_by, params, limit
+                ),
             )
         )
 
@@ -82,7 +207,7 @@ class Database:
         self,
         where_clause: str | None = None,
         order_by: str | None = None,
-        params: list[str] | None = None,
+        params: Sequence[str | int] | None = None,
     ) -> list[TaskHistoryRecord]:
         return list(
             map(
@@ -98,16 +223,14 @@ class Database:
         table: TableName,
         where_clause: str | None = None,
         order_by: str | None = None,
-        params: list[str] | None = None,
-    ):
-        sql = "SELECT * FROM {table}".format(table=table.value)
-        if where_clause:
-            sql += " WHERE " + where_clause
-        if order_by:
-            sql += " ORDER BY " + order_by
-
+        params: Sequence[str | int] | None = None,
+        limit: int | None = None,
+    ) -> sqlite3.Cursor:
+        """Select rows from a table. The rows are streamed from the returned
+        cursor, so they are only ever held once by whatever consumes them."""
+        sql = _select_sql(table, where_clause, order_by, limit)
         with self.connect() as conn:
-            return conn.execute(sql, params or []).fetchall()
+            return conn.execute(sql, params or [])
 
     def insert_task(
         self,
@@ -116,35 +239,22 @@ class Database:
         description: str | None,
         status: Status,
         created_at: int | None = None,
+        last_modified_at: int | None = None,
     ) -> int:
-        """Insert a new task into the database and return its ID."""
-        if created_at is None:
-            sql = (
-                f"INSERT INTO {TableName.TASKS.value} "
-                "(name,estimate,description,status) "
-                "VALUES (?,?,?,?)"
-            )
-            sql_params = (
-                name,
-                estimate,
-                description,
-                status.value,
-            )
-        else:
-            sql = (
-                f"INSERT INTO {TableName.TASKS.value} "
-                "(name,estimate,description,status,created_at) "
-                "VALUES (?,?,?,?,?)"
-            )
-            sql_params = (
-                name,
-                estimate,
-                description,
-                status.value,
-                created_at,
-            )
-        with self.connect() as conn:
-            new_task_id = conn.execute(sql, sql_params).lastrowid
+        """Insert a new task into the database and return its ID.
+
+        Timestamps default to the current time."""
+        now = self.now()
+        sql_params = (
+            name,
+            estimate,
+            description,
+            status.value,
+            now if last_modified_at is None else last_modified_at,
+            now if created_at is None else created_at,
+        )
+        with self.transaction() as conn:
+            new_task_id = conn.execute(self._INSERT_TASK_SQL, sql_params).lastrowid
             if new_task_id is None:
                 raise AssertionError(f"Could not insert task: {name}")
         return new_task_id
@@ -152,16 +262,38 @@ class Database:
     def insert_history(
         self, taskid: int, is_start: bool, time: int | None = None
     ) -> None:
-        if time is None:
-            sql = (
-                f"INSERT INTO {TableName.HISTORY.value} (taskid,is_start) VALUES (?,?)"
-            )
-            sql_params = (taskid, is_start)
-        else:
-            sql = ("INSERT INTO {table} (taskid,is_start,time) VALUES (?,?,?)").format(
-                table=TableName.HISTORY.value
-            )
-            sql_params = (taskid, is_start, time)
+        """Insert a history record, timed now unless a time is given."""
+        with self.transaction() as conn:
+            sql_params = (taskid, is_start, self.now() if time is None else time)
+            conn.execute(self._INSERT_HISTORY_WITH_TIME_SQL, sql_params)
 
-        with self.connect() as conn:
-            conn.execute(sql, sql_params)
+    def insert_history_many(self, records: list[tuple[int, bool, int]]) -> None:
+        """Insert many (taskid, is_start, time) history records at once."""
+        with self.transaction() as conn:
+            conn.executemany(self._INSERT_HISTORY_WITH_TIME_SQL, records)
+
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    # Recommended by sqlite before closing, cheaply refreshes the planner
+    # statistics when the tables have changed enough to matter
+    conn.execute("PRAGMA optimize")
+    conn.close()
+
+
+@lru_cache(maxsize=64)
+def _select_sql(
+    table: TableName,
+    where_clause: str | None,
+    order_by: str | None,
+    limit: int | None = None,
+) -> str:
+    """Build (and memoize) the SQL for a select, so repeated queries reuse the
+    same string and hit sqlite's prepared statement cache."""
+    sql = f"SELECT * FROM {table.value}"
+    if where_clause:
+        sql += " WHERE " + where_clause
+    if order_by:
+        sql += " ORDER BY " + order_by
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return sql
@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from functools import total_ordering
 
 from thunter.constants import (
-    STATUS_ORDERING,
+    STATUS_FROM_VALUE,
+    STATUS_RANK,
     Status,
 )
 from thunter.time import display_time
@@ -29,14 +30,15 @@ class Task:
     def from_db_record(
         cls, record: tuple[int, str, int | None, str | None, str, int, int]
     ):
+        # positional arguments, in field order, are cheaper than keywords
         return cls(
-            id=record[0],
-            name=record[1],
-            estimate=record[2],
-            description=record[3],
-            status=Status(record[4]),
-            last_modified_at=record[5],
-            created_at=record[6],
+            record[0],
+            record[1],
+            record[2],
+            record[3],
+            STATUS_FROM_VALUE[record[4]],
+            record[5],
+            record[6],
         )
 
     @property
@@ -53,8 +55,11 @@ class Task:
         return estimate_display_str
 
     def __lt__(self, other):
-        return (STATUS_ORDERING.index(self.status.value), -self.last_modified_at) < (
-            STATUS_ORDERING.index(other.status.value),
+        # TaskHunter.get_tasks returns tasks in this order straight from sqlite,
+        # keep the two in sync (see TaskHunter._TASK_ORDER_BY)
+        # Status members are str, so they hash and compare as their values
+        return (STATUS_RANK[self.status], -self.last_modified_at) < (
+            STATUS_RANK[other.status],
             -other.last_modified_at,
         )
 
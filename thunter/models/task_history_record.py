@@ -17,23 +17,27 @@ class TaskHistoryRecord:
 
     @classmethod
     def from_db_record(cls, record: tuple[int, int, bool, int]):
-        return cls(
-            id=record[0], taskid=record[1], is_start=bool(record[2]), time=record[3]
-        )
+        return cls(record[0], record[1], bool(record[2]), record[3])
 
     @classmethod
     def calc_progress(cls, task_history: list["TaskHistoryRecord"]) -> int:
-        """Calculates the total time (seconds) spent on a task based on its history records."""
+        """Calculates the total time (seconds) spent on a task based on its history records.
+
+        Starts and stops alternate, so the total is the sum of the stop times
+        minus the sum of the start times, which doesn't need the records sorted.
+        """
         progress = 0
-        start_time = 0
-        for history_record in sorted(task_history):
+        open_sessions = 0
+        for history_record in task_history:
             if history_record.is_start:
-                start_time = history_record.time
+                progress -= history_record.time
+                open_sessions += 1
             else:
-                progress += history_record.time - start_time
-                start_time = 0
-        if task_history and start_time:
-            progress += int(time()) - start_time
+                progress += history_record.time
+                open_sessions -= 1
+        if open_sessions > 0:
+            # still being tracked, count up to now
+            progress += int(time())
         return progress
 
     @classmethod
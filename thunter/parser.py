@@ -1,11 +1,14 @@
-import calendar
 from dataclasses import dataclass
-from time import strptime
-from typing import TypeGuard
-
-import pyparsing as pp
-
-from thunter.constants import TIME_FORMAT, ThunterTaskValidationError, Status
+from datetime import datetime, timezone
+import operator
+import re
+
+from thunter.constants import (
+    STATUS_FROM_VALUE,
+    TIME_FORMAT,
+    ThunterTaskValidationError,
+    Status,
+)
 from thunter.models import Task, TaskHistoryRecord
 
 
@@ -24,68 +27,84 @@ class ParsedTaskData:
     history: list[ParsedTaskHistoryRecord]
 
 
-def parse_time(t: pp.ParseResults) -> int:
-    """parser action for converting time string to seconds"""
-    if isinstance(t.time, str):
-        return calendar.timegm(strptime(t.time, TIME_FORMAT))
-    raise ValueError
-
-
-word = pp.Word(pp.alphanums + " .!?&-_()")
-number = pp.common.integer
-status_type = pp.one_of([s.value for s in Status]).set_parse_action(
-    lambda t: Status(t.status)
-)
-is_start = pp.one_of(["Start", "Stop"])("is_start").set_parse_action(
-    lambda t: t[0] == "Start"
-)
-time = pp.Word(pp.nums + " -:")("time").set_parse_action(parse_time)
-name = pp.Suppress("NAME:") + word("name")
-estimate = pp.Suppress("ESTIMATE:") + number("estimate")
-status = pp.Suppress("STATUS:") + status_type("status")
-
-
-description = pp.Suppress("DESCRIPTION:") + pp.rest_of_line(
-    "description"
-).set_parse_action(
-    lambda t: t.description.strip() if isinstance(t.description, str) else ""
-)
-
-history_record = pp.Group(is_start("is_start") + time("time"))
-history = pp.Suppress(pp.Keyword("HISTORY")) + pp.ZeroOrMore(history_record)("history")
-
-task = name + estimate + status + description + history
-
-
-def is_parsed_history(history) -> TypeGuard[list[ParsedTaskHistoryRecord]]:
-    return all(
-        history_record.is_start in [True, False]
-        and isinstance(history_record.time, int)
-        for history_record in history
-    )
-
-
-def is_parsed_task(data) -> TypeGuard[ParsedTaskData]:
-    return (
-        isinstance(data.name, str)
-        and isinstance(data.estimate, (int, type(None)))
-        and isinstance(data.description, (str, type(None)))
-        and isinstance(data.status, Status)
-        and is_parsed_history(data.history)
+# e.g. "Start\t2021-09-30 21:20:00", see `display_task`
+_HISTORY_RECORD_RE = re.compile(r"(Start|Stop)\s+(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+_HEADER_FIELDS = ("NAME", "ESTIMATE", "STATUS", "DESCRIPTION")
+
+
+def parse_time(time_display: str) -> int:
+    """Convert a displayed time (see TIME_FORMAT) back to seconds since epoch.
+
+    :raises ValueError: If it isn't a valid time."""
+    # The format is fixed width, slicing out the fields is several times
+    # faster than strptime and datetime still rejects impossible dates
+    t = time_display
+    if len(t) != 19:
+        raise ValueError(f"time '{t}' does not match format '{TIME_FORMAT}'")
+    parsed = datetime(
+        int(t[0:4]),
+        int(t[5:7]),
+        int(t[8:10]),
+        int(t[11:13]),
+        int(t[14:16]),
+        int(t[17:19]),
+        tzinfo=timezone.utc,
     )
+    return int(parsed.timestamp())
 
 
 def parse_task_display(task_display: str) -> ParsedTaskData:
     """Parses a task's display string into the data necessary to create the task and it's history"""
-    task_data = task.parse_string(task_display)
-
-    if not (is_parsed_task(task_data)):
-        raise AssertionError("Invalid parsed task data")
+    # one field or history record per line, blank lines are ignored
+    lines = [line.strip() for line in task_display.splitlines()]
+    lines = [line for line in lines if line]
+    thunter_assert(
+        len(lines) >= 5 and lines[4] == "HISTORY",
+        "Expected NAME, ESTIMATE, STATUS and DESCRIPTION followed by HISTORY",
+    )
+    name, estimate, status, description = (
+        _parse_field(line, field) for line, field in zip(lines, _HEADER_FIELDS)
+    )
+    thunter_assert(name, "NAME can't be empty")
+    thunter_assert(
+        estimate == "None" or estimate.isdigit(), "ESTIMATE must be a whole number"
+    )
+    thunter_assert(
+        status in STATUS_FROM_VALUE,
+        "STATUS must be one of: " + ", ".join(STATUS_FROM_VALUE),
+    )
 
+    history = []
+    for line in lines[5:]:
+        match = _HISTORY_RECORD_RE.fullmatch(line)
+        thunter_assert(match, "Invalid history record: %s" % line)
+        if match:
+            is_start, time_display = match.groups()
+            history.append(
+                ParsedTaskHistoryRecord(
+                    is_start=is_start == "Start", time=parse_time(time_display)
+                )
+            )
+
+    task_data = ParsedTaskData(
+        name=name,
+        # display_task shows missing values as None
+        estimate=None if estimate == "None" else int(estimate),
+        description=None if description == "None" else description,
+        status=STATUS_FROM_VALUE[status],
+        history=history,
+    )
     validate_task_data(task_data)
     return task_data
 
 
+def _parse_field(line: str, field: str) -> str:
+    """The value of a `FIELD: value` line."""
+    label = field + ":"
+    thunter_assert(line.startswith(label), "Expected %s on line: %s" % (label, line))
+    return line.removeprefix(label).strip()
+
+
 def thunter_assert(expr, message):
     if not expr:
         error_message = f"[red]Task Validation Error:[/red] {message}"
@@ -117,31 +136,32 @@ def validate_task_data(task_data: ParsedTaskData) -> None:
             % task_data.status.value,
         )
 
-    expect_start = True
-    last_history_time = 0
-    for history_data in task_data.history:
-        thunter_assert(
-            last_history_time <= history_data.time,
-            "History must be in ascending order by time",
-        )
-        thunter_assert(
-            history_data.is_start == expect_start,
-            "History must alternate between Start and Stop",
-        )
-        expect_start = not expect_start
-        last_history_time = history_data.time
+    # checked column by column, so the comparisons run in C
+    times = [history_data.time for history_data in task_data.history]
+    thunter_assert(
+        all(map(operator.le, times, times[1:])),
+        "History must be in ascending order by time",
+    )
+    starts = [history_data.is_start for history_data in task_data.history]
+    thunter_assert(
+        all(starts[::2]) and not any(starts[1::2]),
+        "History must alternate between Start and Stop",
+    )
 
 
 def display_task(task: Task, task_history: list[TaskHistoryRecord]) -> str:
     """Displays a task in a human-readable and parser friendly format."""
-    lines = []
-    lines.append("NAME: %s" % task.name)
-    lines.append("ESTIMATE: %s" % task.estimate)
-    lines.append("STATUS: %s" % task.status.value)
-    lines.append("DESCRIPTION: %s" % task.description)
-    lines.append("")
-    lines.append("HISTORY")
-    for history_record in task_history:
-        record_type = "Start" if history_record.is_start else "Stop"
-        lines.append(record_type + "\t" + history_record.time_display)
-    return "\n".join(lines + [""])
+    header = (
+        f"NAME: {task.name}\n"
+        f"ESTIMATE: {task.estimate}\n"
+        f"STATUS: {task.status.value}\n"
+        f"DESCRIPTION: {task.description}\n"
+        "\n"
+        "HISTORY\n"
+    )
+    return header + "".join(map(_display_history_record, task_history))
+
+
+def _display_history_record(history_record: TaskHistoryRecord) -> str:
+    record_type = "Start" if history_record.is_start else "Stop"
+    return f"{record_type}\t{history_record.time_display}\n"
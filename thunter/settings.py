@@ -1,5 +1,6 @@
+from functools import cache
 import os
-from rich.console import Console
+import sys
 
 
 THUNTER_DIR = os.path.expanduser(os.environ.get("THUNTER_DIRECTORY", "~/.thunter"))
@@ -7,6 +8,8 @@ DATABASE = os.path.join(
     THUNTER_DIR, os.environ.get("THUNTER_DATABASE_NAME", "thunter_database.db")
 )
 EDITOR = os.environ.get("EDITOR", "vim")
+# EDITOR may include arguments, e.g. "code --wait"
+EDITOR_ARGV = tuple(EDITOR.split())
 THUNTER_SILENT = os.environ.get("THUNTER_SILENT", "false").lower() in (
     "true",
     "1",
@@ -22,16 +25,30 @@ print_config = {"silent": THUNTER_SILENT, "debug": DEBUG}
 
 def thunter_print(*args, **kwargs):
     """Prints to console if not in silent mode."""
-    if not THUNTER_SILENT and not print_config["silent"]:
-        console = Console()
-        console.print(*args, **kwargs)
+    # print_config["silent"] already accounts for THUNTER_SILENT
+    if not print_config["silent"]:
+        get_console().print(*args, **kwargs)
+
+
+def confirm(prompt: str) -> bool:
+    """Ask a y/N question on stdin, anything but "y" (including EOF) is a no."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip().lower() == "y"
+
+
+@cache
+def get_console():
+    """Shared rich Console, created on first use.
+
+    rich is slow to import, so only pay for it when there is output."""
+    from rich.console import Console
+
+    return Console()
 
 
 def needs_init():
     """Checks if `thunter init` needs to be run to setup the environment."""
-    return (
-        not THUNTER_DIR
-        or not DATABASE
-        or not os.path.exists(THUNTER_DIR)
-        or not os.path.exists(DATABASE)
-    )
+    # a single stat, the database can only exist if its directory does and
+    # an empty DATABASE path never exists
+    return not THUNTER_DIR or not os.path.exists(DATABASE)
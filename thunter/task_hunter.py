@@ -1,4 +1,8 @@
+from contextlib import contextmanager
+from dataclasses import replace
+
 from thunter.constants import (
+    STATUS_ORDERING,
     Status,
     TableName,
     ThunterCouldNotFindTaskError,
@@ -7,11 +11,55 @@ from thunter.constants import (
 from thunter.db import Database
 from thunter.models import Task, TaskHistoryRecord, TaskIdentifier
 from thunter.parser import display_task
+from thunter.time import now_sec
 
 
 class TaskHunter(Database):
     """The tasks manager class for interacting with tasks and their time tracking history."""
 
+    _SELECT_STATUS_SQL = f"SELECT status FROM {TableName.TASKS.value} WHERE id=?"
+    _SELECT_LAST_MODIFIED_AT_SQL = (
+        f"SELECT last_modified_at FROM {TableName.TASKS.value} WHERE id=?"
+    )
+    _DELETE_TASK_SQL = f"DELETE from {TableName.TASKS.value} WHERE id=?"
+    _DELETE_HISTORY_SQL = f"DELETE from {TableName.HISTORY.value} WHERE taskid=?"
+    _UPDATE_TASK_SQL = (
+        f"UPDATE {TableName.TASKS.value} "
+        "SET name=?, estimate=?, description=?, status=?, last_modified_at=? "
+        "WHERE id=?"
+    )
+    # Same ordering as sorting Task objects, but done by sqlite
+    _TASK_ORDER_BY = (
+        "CASE status "
+        + " ".join(
+            f"WHEN '{status}' THEN {rank}"
+            for rank, status in enumerate(STATUS_ORDERING)
+        )
+        + " END, last_modified_at DESC, id"
+    )
+    # Total time (seconds) spent on a task, summed up from its history records.
+    # A task still being tracked counts up to the time bound to the ? param.
+    _PROGRESS_SUM = (
+        "SUM(CASE WHEN is_start THEN -time ELSE time END) "
+        "+ CASE WHEN SUM(is_start) > SUM(NOT is_start) THEN ? ELSE 0 END"
+    )
+
+    def __init__(self, database=None):
+        super().__init__(database)
+        # get_current_task result, cached until the next write
+        self._current_task: Task | None = None
+        self._current_task_fetched = False
+
+    @contextmanager
+    def transaction(self):
+        # any write may change which task is current
+        self._current_task_fetched = False
+        try:
+            with super().transaction() as conn:
+                yield conn
+        finally:
+            self._current_task_fetched = False
+
     def get_task(
         self,
         task_identifier: TaskIdentifier | None = None,
@@ -39,21 +87,34 @@ class TaskHunter(Database):
                 params = []
                 if statuses:
                     where_clause = "status IN (" + ",".join(len(statuses) * "?") + ")"
-                    params.extend(map(lambda s: s.value, statuses))
+                    params.extend(statuses)
                 recent_tasks = self.select_from_task(
                     order_by="last_modified_at DESC",
                     where_clause=where_clause,
                     params=params,
+                    limit=1,
                 )
                 if recent_tasks:
                     return recent_tasks[0]
                 raise ThunterCouldNotFindTaskError("No task found.")
             return current_task
 
-        params: list[str] = []
+        params: list[str | int] = []
         if isinstance(task_identifier, int) or task_identifier.isdigit():
+            # ids are unique, a primary key lookup with nothing to sort
             where_clause = "id=?"
-            params = [str(task_identifier)]
+            if statuses:
+                where_clause += " AND status IN (" + ",".join(len(statuses) * "?") + ")"
+            tasks = self.select_from_task(
+                where_clause=where_clause,
+                params=[int(task_identifier), *(statuses or ())],
+                limit=1,
+            )
+            if not tasks:
+                raise ThunterCouldNotFindTaskError(
+                    f"Could not find task for identifier: {task_identifier}"
+                )
+            return tasks[0]
         elif exact_match:
             where_clause = "name = ?"
             params = [task_identifier]
@@ -63,7 +124,7 @@ class TaskHunter(Database):
 
         if statuses:
             where_clause += " AND status IN (" + ",".join(len(statuses) * "?") + ")"
-            params.extend(map(lambda s: s.value, statuses))
+            params.extend(statuses)
 
         order_by: str = "last_modified_at DESC"
         tasks = self.select_from_task(
@@ -81,14 +142,62 @@ class TaskHunter(Database):
 
         return tasks[0]
 
-    def display_task(self, taskid: int):
+    def display_task(self, task: Task | int):
         """Return a string representation of the task and its history.
 
-        This representation is able to be parsed and is used by the edit command."""
-        task = self.get_task(taskid)
-        task_history = self.get_history([taskid])
+        This representation is able to be parsed and is used by the edit command.
+        Takes the task itself, if already fetched, or its id."""
+        if isinstance(task, Task):
+            task_history = self.get_history([task.id])
+        else:
+            task, task_history = self.get_task_with_history(task)
         return display_task(task=task, task_history=task_history)
 
+    def get_task_with_history(
+        self, taskid: int
+    ) -> tuple[Task, list[TaskHistoryRecord]]:
+        """Fetch a task by its id along with its history, in a single query.
+
+        :raises ThunterCouldNotFindTaskError: If there is no task with that id.
+        """
+        tasks_with_history = self.get_tasks_with_history([taskid])
+        if taskid not in tasks_with_history:
+            raise ThunterCouldNotFindTaskError(
+                f"Could not find task for identifier: {taskid}"
+            )
+        return tasks_with_history[taskid]
+
+    def get_tasks_with_history(
+        self, taskids: list[int]
+    ) -> dict[int, tuple[Task, list[TaskHistoryRecord]]]:
+        """Fetch tasks by their ids along with their histories, in a single query.
+
+        Keyed by task id, in id order. Ids without a task are left out.
+        """
+        if not taskids:
+            return {}
+        sql = (
+            f"SELECT {TableName.TASKS.value}.*, "
+            f"{TableName.HISTORY.value}.id, is_start, time "
+            f"FROM {TableName.TASKS.value} LEFT JOIN {TableName.HISTORY.value} "
+            f"ON taskid = {TableName.TASKS.value}.id "
+            f"WHERE {TableName.TASKS.value}.id IN ("
+            + ",".join(len(taskids) * "?")
+            + f") ORDER BY {TableName.TASKS.value}.id, time, is_start DESC"
+        )
+        tasks_with_history: dict[int, tuple[Task, list[TaskHistoryRecord]]] = {}
+        with self.connect() as conn:
+            for record in conn.execute(sql, taskids):
+                taskid = record[0]
+                if taskid not in tasks_with_history:
+                    tasks_with_history[taskid] = (Task.from_db_record(record), [])
+                # a task without history still has one row, with NULL history columns
+                if record[7] is not None:
+                    tasks_with_history[taskid][1].append(
+                        TaskHistoryRecord(record[7], taskid, bool(record[8]), record[9])
+                    )
+        return tasks_with_history
+
     def create_task(
         self,
         name: str,
@@ -108,14 +217,46 @@ class TaskHunter(Database):
             raise ValueError(
                 "Task cannot be a number, as that would conflict with task IDs."
             )
+        now = self.now()
+        if created_at is None:
+            created_at = now
         new_task_id = self.insert_task(
             name=name,
             estimate=estimate,
             description=description,
             status=status,
             created_at=created_at,
+            last_modified_at=now,
         )
-        return self.get_task(new_task_id)
+        # everything is known already, no need to read the task back
+        return Task(new_task_id, name, estimate, description, status, now, created_at)
+
+    def update_task(
+        self,
+        taskid: int,
+        name: str,
+        estimate: int | None,
+        description: str | None,
+        status: Status,
+    ) -> None:
+        """Update all the editable fields of a task at once, keeping its ID."""
+        if name.isdigit():
+            raise ValueError(
+                "Task cannot be a number, as that would conflict with task IDs."
+            )
+        with self.transaction() as conn:
+            conn.execute(
+                self._UPDATE_TASK_SQL,
+                (name, estimate, description, status, self.now(), taskid),
+            )
+
+    def replace_history(self, taskid: int, history: list[tuple[bool, int]]) -> None:
+        """Replace all of a task's history with the given (is_start, time) records."""
+        with self.transaction() as conn:
+            conn.execute(self._DELETE_HISTORY_SQL, [taskid])
+            self.insert_history_many(
+                [(taskid, is_start, time) for is_start, time in history]
+            )
 
     def get_tasks(
         self,
@@ -123,7 +264,48 @@ class TaskHunter(Database):
         starts_with: str | None = None,
         contains: str | None = None,
     ) -> list[Task]:
-        """Fetch a list tasks from the database with optional filters."""
+        """Fetch a list tasks from the database with optional filters.
+
+        The tasks come back already sorted (see `Task.__lt__`), ordered by sqlite."""
+        where_clause, params = self._tasks_where(statuses, starts_with, contains)
+        return self.select_from_task(
+            where_clause=where_clause, order_by=self._TASK_ORDER_BY, params=params
+        )
+
+    def get_tasks_with_progress(
+        self,
+        statuses: set[Status] | None = None,
+        starts_with: str | None = None,
+        contains: str | None = None,
+    ) -> list[tuple[Task, int]]:
+        """Same as `get_tasks`, paired with the progress (seconds) of each task.
+
+        Both come from a single query. The progress is the same as
+        `TaskHistoryRecord.calc_progress`, but summed up by sqlite so the
+        history records never need to be loaded."""
+        where_clause, params = self._tasks_where(statuses, starts_with, contains)
+        sql = (
+            f"SELECT *, COALESCE((SELECT {self._PROGRESS_SUM} "
+            f"FROM {TableName.HISTORY.value} "
+            f"WHERE taskid = {TableName.TASKS.value}.id), 0) "
+            f"FROM {TableName.TASKS.value}"
+        )
+        if where_clause:
+            sql += " WHERE " + where_clause
+        sql += " ORDER BY " + self._TASK_ORDER_BY
+        with self.connect() as conn:
+            return [
+                (Task.from_db_record(record), record[-1])
+                for record in conn.execute(sql, [now_sec(), *(params or [])])
+            ]
+
+    @staticmethod
+    def _tasks_where(
+        statuses: set[Status] | None,
+        starts_with: str | None,
+        contains: str | None,
+    ) -> tuple[str | None, list[str] | None]:
+        """Build the where clause and its params for the task filters."""
         where_clause_param_pairs = []
         if starts_with:
             where_clause_param_pairs.append(("name LIKE ?", (starts_with + "%",)))
@@ -133,7 +315,7 @@ class TaskHunter(Database):
             where_clause_param_pairs.append(
                 (
                     "status IN (" + ",".join(len(statuses) * "?") + ")",
-                    map(lambda s: s.value, statuses),
+                    tuple(statuses),
                 )
             )
         if where_clause_param_pairs:
@@ -143,36 +325,44 @@ class TaskHunter(Database):
         else:
             where_clause = None
             params = None
-
-        tasks = self.select_from_task(where_clause=where_clause, params=params)
-        return sorted(tasks)
+        return where_clause, params
 
     def get_history(self, taskids: list[int]) -> list[TaskHistoryRecord]:
         """Fetch the history records for a given task or list of tasks."""
-        assert all(map(lambda taskid: isinstance(taskid, int), taskids))
+        assert all(isinstance(taskid, int) for taskid in taskids)
 
         where_clause = "taskid IN (" + ",".join(len(taskids) * "?") + ")"
-        history = self.select_from_history(
-            where_clause=where_clause, params=list(map(str, taskids))
+        # Same ordering as sorting TaskHistoryRecord objects, grouped by task
+        return self.select_from_history(
+            where_clause=where_clause,
+            order_by="taskid, time, is_start DESC",
+            params=taskids,
         )
-        return sorted(history)
 
     def get_current_task(self) -> Task | None:
         """Fetch the current task from the database.
 
         There should only ever be one current task actively being worked on at
-        a time.
+        a time. The result is cached until the next write made by this instance.
         """
+        if self._current_task_fetched:
+            return self._current_task
+
+        # the status is inlined so the partial index on current tasks can be
+        # used, two rows are enough to tell whether there's more than one
         current_tasks = self.select_from_task(
-            where_clause="status IN (?)",
-            params=[Status.CURRENT.value],
+            where_clause=f"status = '{Status.CURRENT.value}'", limit=2
         )
-        if len(current_tasks) == 0:
-            return None
-        elif len(current_tasks) > 1:
+        if len(current_tasks) > 1:
             raise AssertionError("More than one current task? How!?")
 
-        return current_tasks[0]
+        self._cache_current_task(current_tasks[0] if current_tasks else None)
+        return self._current_task
+
+    def _cache_current_task(self, task: Task | None) -> None:
+        """Set the cached get_current_task result, when already known after a write."""
+        self._current_task = task
+        self._current_task_fetched = True
 
     def workon_task(self, task_identifier: TaskIdentifier) -> None:
         """Start working on a task by its identifier (name or id).
@@ -184,33 +374,67 @@ class TaskHunter(Database):
         """
         task = self.get_task(task_identifier)
         current_task = self.get_current_task()
-        if current_task:
-            if current_task.id == task.id:
-                return
-            self.insert_history(taskid=current_task.id, is_start=False)
-            self.update_task_field(current_task.id, "status", Status.IN_PROGRESS.value)
-        self.insert_history(taskid=task.id, is_start=True)
-        self.update_task_field(task.id, "status", Status.CURRENT.value)
+        if current_task and current_task.id == task.id:
+            return
+        with self.transaction():
+            if current_task:
+                self.insert_history(taskid=current_task.id, is_start=False)
+                self.update_task_field(
+                    current_task.id, "status", Status.IN_PROGRESS.value
+                )
+            self.insert_history(taskid=task.id, is_start=True)
+            self.update_task_field(task.id, "status", Status.CURRENT.value)
+            last_modified_at = self._last_modified_at(task.id)
+        self._cache_current_task(
+            replace(task, status=Status.CURRENT, last_modified_at=last_modified_at)
+        )
 
     def stop_current_task(self) -> Task | None:
         """Stop tracking the current task and change its status to IN_PROGRESS."""
         current_task = self.get_current_task()
         if not current_task:
             return
-        self.insert_history(taskid=current_task.id, is_start=False)
-        self.update_task_field(current_task.id, "status", Status.IN_PROGRESS.value)
-        return self.get_task(current_task.id)
+        with self.transaction():
+            self.insert_history(taskid=current_task.id, is_start=False)
+            self.update_task_field(current_task.id, "status", Status.IN_PROGRESS.value)
+            last_modified_at = self._last_modified_at(current_task.id)
+        self._cache_current_task(None)
+        return replace(
+            current_task, status=Status.IN_PROGRESS, last_modified_at=last_modified_at
+        )
+
+    def _last_modified_at(self, taskid: int) -> int:
+        """The stored last_modified_at of a task.
+
+        Read back after updating a task, since the last modified trigger
+        overwrites it using sqlite's clock, which can disagree with `now`."""
+        with self.connect() as conn:
+            sql = self._SELECT_LAST_MODIFIED_AT_SQL
+            (last_modified_at,) = conn.execute(sql, [taskid]).fetchone()
+        return last_modified_at
 
     def finish_task(self, taskid: int) -> None:
-        """Mark a task as finished and update its status."""
-        task = self.get_task(taskid)
-        if task.status == Status.CURRENT:
-            self.insert_history(taskid=task.id, is_start=False)
-
-        if task.status != Status.FINISHED:
-            self.update_task_field(
-                taskid=task.id, field="status", value=Status.FINISHED.value
-            )
+        """Mark a task as finished and update its status.
+
+        Stops tracking time on the task first if it is the current task.
+
+        :raises ThunterCouldNotFindTaskError: If there is no task with that id.
+        """
+        with self.transaction() as conn:
+            # only the status is needed to decide what to write
+            row = conn.execute(self._SELECT_STATUS_SQL, [taskid]).fetchone()
+            if row is None:
+                raise ThunterCouldNotFindTaskError(
+                    f"Could not find task for identifier: {taskid}"
+                )
+            status = row[0]
+            if status == Status.CURRENT:
+                self.insert_history(taskid=taskid, is_start=False)
+
+            if status != Status.FINISHED:
+                self.update_task_field(
+                    taskid=taskid, field="status", value=Status.FINISHED.value
+                )
 
     def estimate_task(self, taskid: int, estimate: int) -> None:
         """(Re)set the estimate for a task."""
@@ -218,12 +442,8 @@ class TaskHunter(Database):
 
     def remove_task(self, taskid: int) -> None:
         """Permanently delete a task and its history from the database."""
-        delete_task_sql = "DELETE from {table} WHERE id=?".format(
-            table=TableName.TASKS.value
-        )
-        delete_history_sql = "DELETE from {table} WHERE taskid=?".format(
-            table=TableName.HISTORY.value
-        )
-        with self.connect() as conn:
-            conn.execute(delete_task_sql, [taskid])
-            conn.execute(delete_history_sql, [taskid])
+        with self.transaction() as conn:
+            # history cascades on delete, but databases created by older
+            # versions of thunter lack the cascade, so clear it explicitly first
+            conn.execute(self._DELETE_HISTORY_SQL, [taskid])
+            conn.execute(self._DELETE_TASK_SQL, [taskid])
@@ -1,4 +1,6 @@
+import atexit
 from dataclasses import dataclass
+from functools import cache
 import os
 import shutil
 import sqlite3
@@ -11,6 +13,51 @@ from thunter import settings
 from thunter.task_hunter import TaskHunter
 
 
+# holds no state between invocations, so one is shared by every test
+cli_runner = CliRunner()
+
+# test databases are thrown away, keep them in memory backed tmpfs if there
+# is one (None falls back to the default temp directory)
+_TEMP_ROOT = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+# read once, every test starts from the same fixture
+with open(
+    os.path.join(
+        os.path.dirname(os.path.realpath(__file__)), "test_database_fixture.sql"
+    )
+) as f:
+    _FIXTURE_SQL = f.read()
+
+
+def _load_fixture() -> sqlite3.Connection:
+    """A new in-memory database with the fixture loaded."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(_FIXTURE_SQL)
+    return conn
+
+
+@cache
+def _fixture_image() -> bytes:
+    """The fixture database serialized, built once and written out for each test."""
+    conn = _load_fixture()
+    try:
+        return conn.serialize()
+    finally:
+        conn.close()
+
+
+@cache
+def _fixture_database() -> sqlite3.Connection:
+    """The fixture database kept in memory, built once and copied for each test.
+
+    Only for python versions without `serialize`."""
+    conn = _load_fixture()
+    atexit.register(conn.close)
+    return conn
+
+
 @dataclass
 class TestDatabaseEnvironment:
     THUNTER_DIR: str
@@ -19,7 +66,7 @@ class TestDatabaseEnvironment:
 
 def setUpTestDatabase() -> TestDatabaseEnvironment:
     """Setup a temporary environment and database for testing."""
-    thunter_dir = tempfile.mkdtemp()
+    thunter_dir = tempfile.mkdtemp(dir=_TEMP_ROOT)
     env = TestDatabaseEnvironment(
         THUNTER_DIR=thunter_dir,
         DATABASE=os.path.join(thunter_dir, "test_database.db"),
@@ -27,11 +74,17 @@ def setUpTestDatabase() -> TestDatabaseEnvironment:
     settings.THUNTER_DIR = env.THUNTER_DIR
     settings.DATABASE = env.DATABASE
 
-    conn = sqlite3.connect(env.DATABASE)
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    with open(dir_path + "/test_database_fixture.sql", "r") as f:
-        conn.executescript(f.read())
-    conn.close()
+    if hasattr(sqlite3.Connection, "serialize"):  # python 3.11+
+        # the serialized database is exactly the file sqlite would write
+        with open(env.DATABASE, "wb") as f:
+            f.write(_fixture_image())
+    else:
+        conn = sqlite3.connect(env.DATABASE)
+        # a throwaway database, no need to wait on the disk
+        conn.execute("PRAGMA synchronous=OFF")
+        # copies the pages as they are, rather than running the SQL again
+        _fixture_database().backup(conn)
+        conn.close()
 
     return env
 
@@ -45,8 +98,27 @@ class CliCommandTestBaseClass(TestCase):
     def setUp(self):
         self.env = setUpTestDatabase()
         self.thunter = TaskHunter()
-        self.runner = CliRunner()
+        self.runner = cli_runner
 
     def tearDown(self):
         """Remove the temporary environment and database after tests."""
         tearDownTestDatabase(self.env)
+
+
+class ReadOnlyCliCommandTestBaseClass(TestCase):
+    """For tests that never write to the database, which can then be shared
+    by every test in the class instead of being rebuilt for each one."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.env = setUpTestDatabase()
+        cls.runner = cli_runner
+
+    @classmethod
+    def tearDownClass(cls):
+        tearDownTestDatabase(cls.env)
+
+    def setUp(self):
+        # other test classes may have pointed settings elsewhere in between
+        settings.THUNTER_DIR = self.env.THUNTER_DIR
+        settings.DATABASE = self.env.DATABASE
@@ -11,6 +11,11 @@ class TestCreate(CliCommandTestBaseClass):
         self.assertIn("Test Task", result.output)
         self.assertIn("2", result.output)
         self.assertIn("A test task", result.output)
+        # shown without reading the task back, same as displaying it afterwards
+        self.assertIn(
+            self.thunter.display_task(self.thunter.get_task("Test Task")).strip(),
+            result.output,
+        )
 
     def test_create_with_estimate_prompt(self):
         result = self.runner.invoke(
@@ -0,0 +1,25 @@
+from thunter import settings
+from thunter.cli import thunter_cli_app
+from thunter.tests import CliCommandTestBaseClass
+
+
+class TestEdit(CliCommandTestBaseClass):
+    def setUp(self):
+        super().setUp()
+        self.editor_argv = settings.EDITOR_ARGV
+        # an "editor" that leaves the task display untouched
+        settings.EDITOR_ARGV = ("true",)
+
+    def tearDown(self):
+        settings.EDITOR_ARGV = self.editor_argv
+        super().tearDown()
+
+    def test_edit_task(self):
+        task_display = self.thunter.display_task(1)
+        result = self.runner.invoke(thunter_cli_app, ["edit", "1"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("a test task", result.output)
+
+        edited_task = self.thunter.get_task("a test task")
+        self.assertEqual(edited_task.id, 1)
+        self.assertEqual(self.thunter.display_task(edited_task.id), task_display)
@@ -1,15 +1,18 @@
 from thunter.tests import CliCommandTestBaseClass
 from thunter.cli import thunter_cli_app
+from thunter.constants import ThunterCouldNotFindTaskError
 
 
 class TestEstimate(CliCommandTestBaseClass):
     def test_estimate_current_task(self):
         result = self.runner.invoke(thunter_cli_app, ["estimate", "7"])
         self.assertIn("a long task estimated to take 7 hrs.", result.output)
+        self.assertEqual(self.thunter.get_current_task().estimate, 7)
 
     def test_estimate_no_current_task(self):
         self.runner.invoke(thunter_cli_app, ["stop"])
         result = self.runner.invoke(thunter_cli_app, ["estimate", "7"])
+        self.assertIsInstance(result.exception, ThunterCouldNotFindTaskError)
         self.assertIn("No current task found to estimate.", str(result.exception))
         self.assertGreater(result.exit_code, 0)
 
@@ -1,5 +1,6 @@
 from thunter.tests import CliCommandTestBaseClass
 from thunter.cli import thunter_cli_app
+from thunter.constants import ThunterCouldNotFindTaskError
 
 
 class TestFinish(CliCommandTestBaseClass):
@@ -19,5 +20,6 @@ class TestFinish(CliCommandTestBaseClass):
 
     def test_finish_no_task_found(self):
         result = self.runner.invoke(thunter_cli_app, ["finish", "9999"])
+        self.assertIsInstance(result.exception, ThunterCouldNotFindTaskError)
         self.assertIn("Could not find task for identifier: 9999", str(result.exception))
         self.assertGreater(result.exit_code, 0)
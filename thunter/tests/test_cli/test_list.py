@@ -1,63 +1,63 @@
+import re
+
 from thunter.cli import thunter_cli_app
-from thunter.tests import CliCommandTestBaseClass
+from thunter.constants import Status
+from thunter.tests import ReadOnlyCliCommandTestBaseClass
+
+_STATUS_RE = re.compile("|".join(status.value for status in Status))
+
 
+def listed_statuses(output: str) -> set[str]:
+    """The statuses that show up anywhere in the output, found in one scan."""
+    return set(_STATUS_RE.findall(output))
 
-class TestList(CliCommandTestBaseClass):
+
+class TestList(ReadOnlyCliCommandTestBaseClass):
     def test_list_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls"])
-        self.assertIn("Current", result.output)
-        self.assertIn("In Progress", result.output)
-        self.assertIn("TODO", result.output)
-        self.assertNotIn("Finished", result.output)
+        self.assertEqual(
+            listed_statuses(result.output), {"Current", "In Progress", "TODO"}
+        )
+
+    def test_list_alias(self):
+        result = self.runner.invoke(thunter_cli_app, ["list"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            result.output, self.runner.invoke(thunter_cli_app, ["ls"]).output
+        )
 
     def test_list_all_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--all"])
-        self.assertIn("Current", result.output)
-        self.assertIn("In Progress", result.output)
-        self.assertIn("TODO", result.output)
-        self.assertIn("Finished", result.output)
+        self.assertEqual(
+            listed_statuses(result.output),
+            {"Current", "In Progress", "TODO", "Finished"},
+        )
 
     def test_list_finished_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--finished"])
-        self.assertNotIn("Current", result.output)
-        self.assertNotIn("In Progress", result.output)
-        self.assertNotIn("TODO", result.output)
-        self.assertIn("Finished", result.output)
+        self.assertEqual(listed_statuses(result.output), {"Finished"})
 
     def test_list_todo_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--todo"])
-        self.assertNotIn("Current", result.output)
-        self.assertNotIn("In Progress", result.output)
-        self.assertIn("TODO", result.output)
-        self.assertNotIn("Finished", result.output)
+        self.assertEqual(listed_statuses(result.output), {"TODO"})
 
     def test_list_open_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--open"])
-        self.assertIn("Current", result.output)
-        self.assertIn("In Progress", result.output)
-        self.assertIn("TODO", result.output)
-        self.assertNotIn("Finished", result.output)
+        self.assertEqual(
+            listed_statuses(result.output), {"Current", "In Progress", "TODO"}
+        )
 
     def test_list_started_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--started"])
-        self.assertIn("Current", result.output)
-        self.assertIn("In Progress", result.output)
-        self.assertNotIn("TODO", result.output)
-        self.assertNotIn("Finished", result.output)
+        self.assertEqual(listed_statuses(result.output), {"Current", "In Progress"})
 
     def test_list_current_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--current"])
-        self.assertIn("Current", result.output)
-        self.assertNotIn("In Progress", result.output)
-        self.assertNotIn("TODO", result.output)
-        self.assertNotIn("Finished", result.output)
+        self.assertEqual(listed_statuses(result.output), {"Current"})
 
     def test_list_in_progress_tasks(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--in-progress"])
-        self.assertNotIn("Current", result.output)
-        self.assertIn("In Progress", result.output)
-        self.assertNotIn("TODO", result.output)
-        self.assertNotIn("Finished", result.output)
+        self.assertEqual(listed_statuses(result.output), {"In Progress"})
 
     def test_list_starts_with(self):
         result = self.runner.invoke(thunter_cli_app, ["ls", "--starts-with", "a "])
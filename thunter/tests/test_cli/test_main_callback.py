@@ -1,36 +1,64 @@
+from contextlib import redirect_stdout
+import io
 import os
+import sys
 import tempfile
-from unittest import TestCase
-
-from typer.testing import CliRunner
+from unittest import TestCase, mock
 
 from thunter import settings
-from thunter.cli import thunter_cli_app
+from thunter.cli import get_version, main, thunter_cli_app
+from thunter.tests import cli_runner
 
 
 class TestMainCallback(TestCase):
     def test_help(self):
-        runner = CliRunner()
-        result = runner.invoke(thunter_cli_app, ["--help"])
+        result = cli_runner.invoke(thunter_cli_app, ["--help"])
         self.assertIn("Usage: thunter", result.output)
         self.assertIn("THunter - your task hunter", result.output)
+        # lazily loaded subcommands are still listed
+        self.assertIn("ls, list", result.output)
+        self.assertIn("rm, remove", result.output)
+
+    def test_version(self):
+        result = cli_runner.invoke(thunter_cli_app, ["--version"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertRegex(result.output, r"^thunter \S+$")
+
+    def test_version_fast_path(self):
+        stdout = io.StringIO()
+        with (
+            mock.patch.object(sys, "argv", ["thunter", "--version"]),
+            redirect_stdout(stdout),
+        ):
+            main()
+        self.assertEqual(stdout.getvalue(), f"thunter {get_version()}\n")
+
+    def patch_thunter_dir(self, thunter_dir: str):
+        """Point settings at an uninitialized thunter directory, restoring them
+        after the test."""
+        for name, value in [
+            ("THUNTER_DIR", thunter_dir),
+            ("DATABASE", os.path.join(thunter_dir, "uninitialized.db")),
+        ]:
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
     def test_init_called_by_default(self):
         with tempfile.TemporaryDirectory() as thunter_dir:
-            settings.THUNTER_DIR = thunter_dir
-            settings.DATABASE = os.path.join(thunter_dir, "uninitialized.db")
-            runner = CliRunner()
-            result = runner.invoke(thunter_cli_app, ["ls"])
+            self.patch_thunter_dir(thunter_dir)
+            result = cli_runner.invoke(thunter_cli_app, ["ls"])
             self.assertIn("Initializing THunter...", result.output)
 
             self.assertTrue(os.path.exists(thunter_dir + "/uninitialized.db"))
 
     def test_thunter_silent(self):
-        with tempfile.TemporaryDirectory() as thunter_dir:
-            settings.THUNTER_DIR = thunter_dir
-            settings.DATABASE = os.path.join(thunter_dir, "uninitialized.db")
-            runner = CliRunner()
-            result = runner.invoke(
+        with (
+            tempfile.TemporaryDirectory() as thunter_dir,
+            mock.patch.dict(settings.print_config),
+        ):
+            self.patch_thunter_dir(thunter_dir)
+            result = cli_runner.invoke(
                 thunter_cli_app,
                 ["--silent", "create", "Silent Task", "--estimate", "1"],
             )
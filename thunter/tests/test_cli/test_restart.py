@@ -1,6 +1,7 @@
 import re
 from thunter.tests import CliCommandTestBaseClass
 from thunter.cli import thunter_cli_app
+from thunter.constants import ThunterCouldNotFindTaskError
 
 
 class TestRestart(CliCommandTestBaseClass):
@@ -10,6 +11,7 @@ class TestRestart(CliCommandTestBaseClass):
 
     def test_restart_no_task(self):
         result = self.runner.invoke(thunter_cli_app, ["restart", "a long task"])
+        self.assertIsInstance(result.exception, ThunterCouldNotFindTaskError)
         self.assertIn(
             "Could not find task for identifier: a long task", str(result.exception)
         )
@@ -15,6 +15,11 @@ class TestRm(CliCommandTestBaseClass):
         )
         self.assertIn("Removed a finished task!", result.output)
 
+    def test_rm_no_input(self):
+        result = self.runner.invoke(thunter_cli_app, ["rm", "a finished task"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Didn't remove a finished task.", result.output)
+
     def test_rm_force(self):
         result = self.runner.invoke(
             thunter_cli_app, ["rm", "a finished task", "--force"]
@@ -1,5 +1,6 @@
 from thunter.tests import CliCommandTestBaseClass
 from thunter.cli import thunter_cli_app
+from thunter.constants import ThunterCouldNotFindTaskError
 
 
 class TestShow(CliCommandTestBaseClass):
@@ -16,6 +17,7 @@ class TestShow(CliCommandTestBaseClass):
 
     def test_show_nonexistent_task(self):
         result = self.runner.invoke(thunter_cli_app, ["show", "999"])
+        self.assertIsInstance(result.exception, ThunterCouldNotFindTaskError)
         self.assertIn("Could not find task for identifier: 999", str(result.exception))
         self.assertGreater(result.exit_code, 0)
 
@@ -1,6 +1,7 @@
 import re
 from thunter.tests import CliCommandTestBaseClass
 from thunter.cli import thunter_cli_app
+from thunter.constants import ThunterCouldNotFindTaskError
 
 
 class TestWorkon(CliCommandTestBaseClass):
@@ -22,11 +23,13 @@ class TestWorkon(CliCommandTestBaseClass):
 
     def test_workon_nonexistent_task_by_id(self):
         result = self.runner.invoke(thunter_cli_app, ["workon", "999"])
+        self.assertIsInstance(result.exception, ThunterCouldNotFindTaskError)
         self.assertIn("Could not find task for identifier: 999", str(result.exception))
         self.assertGreater(result.exit_code, 0)
 
     def test_workon_nonexistent_task_by_name(self):
         result = self.runner.invoke(thunter_cli_app, ["workon", "a nonexistent task"])
+        self.assertIsInstance(result.exception, ThunterCouldNotFindTaskError)
         self.assertIn(
             "Could not find task for identifier: a nonexistent task",
             str(result.exception),
@@ -54,6 +57,7 @@ class TestWorkon(CliCommandTestBaseClass):
 
         result = self.runner.invoke(thunter_cli_app, ["workon"])
         self.assertGreater(result.exit_code, 0)
+        self.assertIsInstance(result.exception, ThunterCouldNotFindTaskError)
         self.assertIn("No task found", str(result.exception))
 
     def test_workon_create_keeps_prompting_for_estimate(self):
@@ -1,4 +1,5 @@
-from unittest import TestCase
+import os
+from unittest import TestCase, mock
 
 from thunter.constants import Status
 from thunter.db import Database
@@ -7,7 +8,7 @@ from thunter.models.task_history_record import TaskHistoryRecord
 from thunter.tests import setUpTestDatabase, tearDownTestDatabase
 
 
-class TestTaskHunter(TestCase):
+class TestDatabase(TestCase):
     def setUp(self):
         self.env = setUpTestDatabase()
         self.database = Database()
@@ -23,6 +24,89 @@ class TestTaskHunter(TestCase):
         thunter = Database("/database.db")
         self.assertEqual(thunter.database, "/database.db")
 
+    def test_init_db(self):
+        database = Database(os.path.join(self.env.THUNTER_DIR, "new_database.db"))
+        with mock.patch.object(
+            Database,
+            "_upgrade_schema",
+            autospec=True,
+            side_effect=Database._upgrade_schema,
+        ) as upgrade_schema:
+            database.init_db()
+            # already initialized, by this instance or another
+            database.init_db()
+            Database(database.database).init_db()
+        upgrade_schema.assert_called_once()
+        with database.connect() as conn:
+            index_names = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+        self.assertIn("idx_tasks_status", index_names)
+        self.assertIn("idx_tasks_name", index_names)
+        self.assertIn("idx_history_taskid", index_names)
+        self.assertIn("idx_tasks_current", index_names)
+
+        with database.connect() as conn:
+            query_plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE name LIKE ?", ["a%"]
+            ).fetchall()
+        self.assertIn("idx_tasks_name_nocase", query_plan[0][-1])
+
+        taskid = database.insert_task("a task", 1, None, Status.CURRENT)
+        database.insert_history(taskid, is_start=True)
+        with database.connect() as conn:
+            conn.execute("DELETE FROM tasks WHERE id = ?", [taskid])
+        self.assertEqual(database.select_from_history(), [])
+
+    def test_schema_upgrade(self):
+        # the fixture database was created without indexes
+        self.database.select_from_task()
+        with self.database.connect() as conn:
+            index_names = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        self.assertIn("idx_history_taskid", index_names)
+        self.assertEqual(user_version, Database.SCHEMA_VERSION)
+
+    def test_transaction(self):
+        with self.assertRaises(RuntimeError):
+            with self.database.transaction():
+                self.database.insert_history(taskid=2, is_start=True)
+                raise RuntimeError("abort")
+        self.assertEqual(
+            self.database.select_from_history(where_clause="taskid = 2"), []
+        )
+
+        with self.database.transaction():
+            self.database.insert_history(taskid=2, is_start=True)
+        # visible to other connections once committed
+        self.assertEqual(
+            len(Database().select_from_history(where_clause="taskid = 2")), 1
+        )
+
+    def test_close(self):
+        self.database.insert_history(taskid=2, is_start=True)
+        self.database.close()
+        self.database.close()
+        # reconnects on the next query
+        self.assertEqual(
+            len(self.database.select_from_history(where_clause="taskid = 2")), 1
+        )
+
+    def test_update_task_field(self):
+        self.database.update_task_field(1, "estimate", 7)
+        self.assertEqual(self.database.select_from_task("id = 1")[0].estimate, 7)
+
+        with self.assertRaises(ValueError):
+            self.database.update_task_field(1, "id = 2, name", "injected")
+
     def test_select_from_history(self):
         history = self.database.select_from_history(
             where_clause="taskid = ?",
@@ -53,3 +137,6 @@ class TestTaskHunter(TestCase):
             ),
         ]
         self.assertEqual(history, expected_history)
+
+        tasks = self.database.select_from_task(order_by="id ASC", limit=2)
+        self.assertEqual([task.id for task in tasks], [1, 2])
@@ -1,3 +1,4 @@
+from time import time
 from unittest import TestCase
 
 from thunter.models import TaskHistoryRecord
@@ -25,6 +26,13 @@ class TestTaskHistoryRecord(TestCase):
         progress = TaskHistoryRecord.calc_progress(history)
         self.assertEqual(progress, 120)
 
+        start_time = int(time()) - 30
+        history.append(
+            TaskHistoryRecord(id=5, taskid=1, is_start=True, time=start_time)
+        )
+        progress = TaskHistoryRecord.calc_progress(history)
+        self.assertAlmostEqual(progress, 150, delta=1)
+
     def test_display_progress(self):
         """Test displaying progress in HH:MM:SS format."""
         seconds = 3661
@@ -1,10 +1,11 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from thunter.constants import (
     Status,
     ThunterCouldNotFindTaskError,
     ThunterFoundMultipleTasksError,
 )
+from thunter.models import TaskHistoryRecord
 from thunter.task_hunter import TaskHunter
 from thunter.tests import setUpTestDatabase, tearDownTestDatabase
 
@@ -46,6 +47,8 @@ class TestTaskHunter(TestCase):
 
         current_task = self.thunter.get_current_task()
         self.assertEqual(current_task, default_current_task)
+        # cached until the next write
+        self.assertIs(self.thunter.get_current_task(), current_task)
 
         stopped_current_task = self.thunter.stop_current_task()
         self.assertEqual(stopped_current_task.id, current_task.id)  # type: ignore
@@ -76,6 +79,9 @@ class TestTaskHunter(TestCase):
             "Start\t2025-07-28 19:48:23\n"
             "Stop\t2025-07-28 19:48:46\n",
         )
+        self.assertEqual(
+            self.thunter.display_task(self.thunter.get_task(1)), task_display
+        )
 
     def test_create_task(self):
         new_task = self.thunter.create_task(
@@ -91,7 +97,7 @@ class TestTaskHunter(TestCase):
 
         # Verify the task was added to the database
         fetched_task = self.thunter.get_task(new_task.id)
-        self.assertEqual(fetched_task, new_task)
+        self.assertEqual(vars(fetched_task), vars(new_task))
 
     def test_create_task_invalid_name(self):
         with self.assertRaises(ValueError) as exception:
@@ -109,14 +115,17 @@ class TestTaskHunter(TestCase):
     def test_get_tasks(self):
         tasks = self.thunter.get_tasks()
         self.assertEqual(len(tasks), 6)
-        self.assertIn("a test task", [task.name for task in tasks])
-        self.assertIn("a finished task", [task.name for task in tasks])
-        self.assertIn("a long task", [task.name for task in tasks])
+        self.assertEqual(tasks, sorted(tasks))
+        names = {task.name for task in tasks}
+        self.assertIn("a test task", names)
+        self.assertIn("a finished task", names)
+        self.assertIn("a long task", names)
 
         starts_with_a_tasks = self.thunter.get_tasks(starts_with="a")
         self.assertEqual(len(starts_with_a_tasks), 4)
-        self.assertIn("a test task", [task.name for task in starts_with_a_tasks])
-        self.assertIn("a finished task", [task.name for task in starts_with_a_tasks])
+        starts_with_a_names = {task.name for task in starts_with_a_tasks}
+        self.assertIn("a test task", starts_with_a_names)
+        self.assertIn("a finished task", starts_with_a_names)
 
         contains_great_task = self.thunter.get_tasks(contains="great")
         self.assertEqual(len(contains_great_task), 1)
@@ -133,31 +142,96 @@ class TestTaskHunter(TestCase):
             sorted([task.name for task in todo_tasks]),
         )
 
+    def test_get_tasks_with_history(self):
+        tasks_with_history = self.thunter.get_tasks_with_history([5, 2, 999])
+        self.assertEqual(list(tasks_with_history), [2, 5])
+        for taskid, (task, task_history) in tasks_with_history.items():
+            self.assertEqual(vars(task), vars(self.thunter.get_task(taskid)))
+            self.assertEqual(task_history, self.thunter.get_history([taskid]))
+        self.assertEqual(tasks_with_history[2][1], [])
+        self.assertEqual(self.thunter.get_tasks_with_history([]), {})
+
+    def test_get_task_with_history(self):
+        task, task_history = self.thunter.get_task_with_history(5)
+        self.assertEqual(vars(task), vars(self.thunter.get_task(5)))
+        self.assertEqual(
+            [vars(record) for record in task_history],
+            [vars(record) for record in self.thunter.get_history([5])],
+        )
+
+        task, task_history = self.thunter.get_task_with_history(2)
+        self.assertEqual(task.id, 2)
+        self.assertEqual(task_history, [])
+
+        with self.assertRaises(ThunterCouldNotFindTaskError):
+            self.thunter.get_task_with_history(1000)
+
+    def test_get_history(self):
+        history = self.thunter.get_history([5, 1])
+        self.assertEqual([record.id for record in history], [3, 4, 7, 8, 9])
+        self.assertEqual(history, sorted(history))
+
+    def test_get_tasks_with_progress(self):
+        tasks_with_progress = self.thunter.get_tasks_with_progress(
+            statuses={Status.IN_PROGRESS, Status.TODO}, contains="task"
+        )
+        tasks = [task for task, _ in tasks_with_progress]
+        self.assertEqual(
+            tasks,
+            self.thunter.get_tasks(
+                statuses={Status.IN_PROGRESS, Status.TODO}, contains="task"
+            ),
+        )
+
+        progress = {
+            task.id: task_progress
+            for task, task_progress in self.thunter.get_tasks_with_progress()
+        }
+        self.assertEqual(progress[1], 23)
+        # no history yet
+        self.assertEqual(progress[2], 0)
+        self.assertEqual(progress[4], 5)
+        # task 5 is the current task, still accumulating time
+        self.assertAlmostEqual(
+            progress[5],
+            TaskHistoryRecord.calc_progress(self.thunter.get_history([5])),
+            delta=1,
+        )
+
     def test_workon_task(self):
         current_task = self.thunter.get_task()
         self.assertEqual(current_task.name, "a long task")
         self.assertEqual(current_task.status, Status.CURRENT)
-        current_task_history = self.thunter.get_history([current_task.id])
 
         next_task = self.thunter.get_task(task_identifier="a test task")
-        next_task_history = self.thunter.get_history([next_task.id])
+        taskids = [current_task.id, next_task.id]
+        before = self.thunter.get_tasks_with_history(taskids)
+        current_task_history = before[current_task.id][1]
+        next_task_history = before[next_task.id][1]
 
         # Start working on the next task
         self.thunter.workon_task(next_task.id)
 
         new_current_task = self.thunter.get_task()
         self.assertEqual(new_current_task, next_task)
+        # cached by workon_task, same as a fresh fetch
+        self.assertEqual(vars(new_current_task), vars(TaskHunter().get_current_task()))
 
-        previously_current_task = self.thunter.get_task(current_task.id)
-        previously_current_task_history = self.thunter.get_history(
-            [previously_current_task.id]
-        )
-        new_current_task_history = self.thunter.get_history([new_current_task.id])
+        after = self.thunter.get_tasks_with_history(taskids)
+        previously_current_task, previously_current_task_history = after[
+            current_task.id
+        ]
+        new_current_task_history = after[new_current_task.id][1]
 
         self.assertEqual(len(new_current_task_history), len(next_task_history) + 1)
         self.assertEqual(
             len(previously_current_task_history), len(current_task_history) + 1
         )
+        # the switch happens at a single point in time
+        self.assertEqual(
+            previously_current_task_history[-1].time,
+            new_current_task_history[-1].time,
+        )
         self.assertEqual(new_current_task.status, Status.CURRENT)
         self.assertEqual(previously_current_task.status, Status.IN_PROGRESS)
 
@@ -172,6 +246,26 @@ class TestTaskHunter(TestCase):
         self.assertEqual(unchanged_current_task.status, new_current_task.status)
         self.assertEqual(unchanged_current_task_history, new_current_task_history)
 
+    def test_workon_task_caches_stored_task(self):
+        # the update trigger stamps last_modified_at with sqlite's own clock
+        with mock.patch("thunter.db.now_sec", return_value=1000):
+            self.thunter.workon_task(1)
+        self.assertEqual(
+            vars(self.thunter.get_current_task()),
+            vars(TaskHunter().get_current_task()),
+        )
+
+    def test_workon_task_is_atomic(self):
+        history = self.thunter.get_history([1, 5])
+        with mock.patch.object(
+            self.thunter, "update_task_field", side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                self.thunter.workon_task(1)
+        # the stop record for the current task was rolled back too
+        self.assertEqual(self.thunter.get_history([1, 5]), history)
+        self.assertEqual(self.thunter.get_current_task().id, 5)
+
     def test_stop_current_task(self):
         current_task = self.thunter.get_current_task()
         self.assertIsNotNone(current_task)
@@ -186,6 +280,9 @@ class TestTaskHunter(TestCase):
 
         self.assertEqual(stopped_task.id, current_task.id)
         self.assertEqual(stopped_task.status, Status.IN_PROGRESS)
+        self.assertEqual(
+            vars(stopped_task), vars(self.thunter.get_task(stopped_task.id))
+        )
 
         # Verify the task is no longer current
         self.assertIsNone(self.thunter.get_current_task())
@@ -197,6 +294,15 @@ class TestTaskHunter(TestCase):
         # stopping the current task again should not change anything
         self.assertIsNone(self.thunter.stop_current_task())
 
+    def test_stop_current_task_matches_stored_task(self):
+        # the update trigger stamps last_modified_at with sqlite's own clock
+        with mock.patch("thunter.db.now_sec", return_value=1000):
+            stopped_task = self.thunter.stop_current_task()
+        assert stopped_task
+        self.assertEqual(
+            vars(stopped_task), vars(self.thunter.get_task(stopped_task.id))
+        )
+
     def test_update_finish_task(self):
         current_task = self.thunter.get_task()
         current_history = self.thunter.get_history([current_task.id])
@@ -210,6 +316,14 @@ class TestTaskHunter(TestCase):
         # Verify the task history was updated
         finished_history = self.thunter.get_history([finished_task.id])
         self.assertEqual(len(finished_history), len(current_history) + 1)
+        self.assertIsNone(self.thunter.get_current_task())
+
+        # finishing again changes nothing
+        self.thunter.finish_task(current_task.id)
+        self.assertEqual(self.thunter.get_history([finished_task.id]), finished_history)
+
+        with self.assertRaises(ThunterCouldNotFindTaskError):
+            self.thunter.finish_task(9999)
 
     def test_estimate_task(self):
         current_task = self.thunter.get_task()
@@ -220,8 +334,34 @@ class TestTaskHunter(TestCase):
         updated_task = self.thunter.get_task(current_task.id)
         self.assertEqual(updated_task.estimate, 10)
 
+    def test_update_task(self):
+        self.thunter.update_task(
+            1,
+            name="an updated task",
+            estimate=6,
+            description="updated",
+            status=Status.TODO,
+        )
+        updated_task = self.thunter.get_task(1)
+        self.assertEqual(updated_task.name, "an updated task")
+        self.assertEqual(updated_task.estimate, 6)
+        self.assertEqual(updated_task.description, "updated")
+        self.assertEqual(updated_task.status, Status.TODO)
+
+        with self.assertRaises(ValueError):
+            self.thunter.update_task(1, "42", None, None, Status.TODO)
+
+    def test_replace_history(self):
+        self.thunter.replace_history(1, [(True, 1000), (False, 1060)])
+        history = self.thunter.get_history([1])
+        self.assertEqual(
+            [(record.is_start, record.time) for record in history],
+            [(True, 1000), (False, 1060)],
+        )
+
     def test_remove_task(self):
         current_task = self.thunter.get_task()
         self.thunter.remove_task(current_task.id)
         with self.assertRaises(ThunterCouldNotFindTaskError):
             self.thunter.get_task(current_task.id)
+        self.assertEqual(self.thunter.get_history([current_task.id]), [])
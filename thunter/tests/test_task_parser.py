@@ -7,12 +7,8 @@ from thunter.parser import (
     ParsedTaskHistoryRecord,
     display_task,
     parse_task_display,
+    parse_time,
     validate_task_data,
-    name,
-    estimate,
-    status,
-    description,
-    history,
 )
 
 
@@ -88,158 +84,152 @@ class TestTaskParser(TestCase):
 
     def test_validate_task_data(self):
         """Test validating task data."""
-        task_data = ParsedTaskData(
-            name="TODO task with history!",
-            estimate=3,
-            description="A valid task for testing.",
-            status=Status.TODO,
-            history=[
-                ParsedTaskHistoryRecord(is_start=True, time=1633036800),
-                ParsedTaskHistoryRecord(is_start=False, time=1633037200),
-            ],
-        )
-        with self.assertRaises(ThunterTaskValidationError) as error:
-            validate_task_data(task_data)
-        self.assertIn(
-            "Can't have a history if the status is TODO", str(error.exception)
-        )
-
-        task_data = ParsedTaskData(
-            name="IN_PROGRESS task without history!",
-            estimate=3,
-            description=None,
-            status=Status.IN_PROGRESS,
-            history=[],
-        )
-        with self.assertRaises(ThunterTaskValidationError) as error:
-            validate_task_data(task_data)
-        self.assertIn(
-            "Must have a history if status is In Progress", str(error.exception)
-        )
-
-        task_data = ParsedTaskData(
-            name="CURRENT task that isn't tracking time!",
-            estimate=3,
-            description=None,
-            status=Status.CURRENT,
-            history=[
-                ParsedTaskHistoryRecord(is_start=True, time=1633036800),
-                ParsedTaskHistoryRecord(is_start=False, time=1633037200),
-            ],
-        )
-        with self.assertRaises(ThunterTaskValidationError) as error:
-            validate_task_data(task_data)
-        self.assertIn(
-            "Last history record must be a Start if the status is Current",
-            str(error.exception),
-        )
-
-        task_data = ParsedTaskData(
-            name="IN_PROGRESS task that is tracking time!",
-            estimate=3,
-            description=None,
-            status=Status.IN_PROGRESS,
-            history=[
-                ParsedTaskHistoryRecord(is_start=True, time=1633036800),
-            ],
-        )
-        with self.assertRaises(ThunterTaskValidationError) as error:
-            validate_task_data(task_data)
-        self.assertIn(
-            "Last history record must be a Stop if the status is In Progress",
-            str(error.exception),
-        )
-
-        task_data = ParsedTaskData(
-            name="FINISHED task that is tracking time!",
-            estimate=3,
-            description=None,
-            status=Status.FINISHED,
-            history=[
-                ParsedTaskHistoryRecord(is_start=True, time=1633036800),
-            ],
-        )
-        with self.assertRaises(ThunterTaskValidationError) as error:
-            validate_task_data(task_data)
-        self.assertIn(
-            "Last history record must be a Stop if the status is Finished",
-            str(error.exception),
-        )
-
-        task_data = ParsedTaskData(
-            name="Out of order history",
-            estimate=3,
-            description=None,
-            status=Status.FINISHED,
-            history=[
-                ParsedTaskHistoryRecord(is_start=True, time=1633036805),
-                ParsedTaskHistoryRecord(is_start=False, time=1633036800),
-            ],
-        )
-        with self.assertRaises(ThunterTaskValidationError) as error:
-            validate_task_data(task_data)
-        self.assertIn(
-            "History must be in ascending order by time",
-            str(error.exception),
+        invalid_task_data = [
+            (
+                ParsedTaskData(
+                    name="TODO task with history!",
+                    estimate=3,
+                    description="A valid task for testing.",
+                    status=Status.TODO,
+                    history=[
+                        ParsedTaskHistoryRecord(is_start=True, time=1633036800),
+                        ParsedTaskHistoryRecord(is_start=False, time=1633037200),
+                    ],
+                ),
+                "Can't have a history if the status is TODO",
+            ),
+            (
+                ParsedTaskData(
+                    name="IN_PROGRESS task without history!",
+                    estimate=3,
+                    description=None,
+                    status=Status.IN_PROGRESS,
+                    history=[],
+                ),
+                "Must have a history if status is In Progress",
+            ),
+            (
+                ParsedTaskData(
+                    name="CURRENT task that isn't tracking time!",
+                    estimate=3,
+                    description=None,
+                    status=Status.CURRENT,
+                    history=[
+                        ParsedTaskHistoryRecord(is_start=True, time=1633036800),
+                        ParsedTaskHistoryRecord(is_start=False, time=1633037200),
+                    ],
+                ),
+                "Last history record must be a Start if the status is Current",
+            ),
+            (
+                ParsedTaskData(
+                    name="IN_PROGRESS task that is tracking time!",
+                    estimate=3,
+                    description=None,
+                    status=Status.IN_PROGRESS,
+                    history=[
+                        ParsedTaskHistoryRecord(is_start=True, time=1633036800),
+                    ],
+                ),
+                "Last history record must be a Stop if the status is In Progress",
+            ),
+            (
+                ParsedTaskData(
+                    name="FINISHED task that is tracking time!",
+                    estimate=3,
+                    description=None,
+                    status=Status.FINISHED,
+                    history=[
+                        ParsedTaskHistoryRecord(is_start=True, time=1633036800),
+                    ],
+                ),
+                "Last history record must be a Stop if the status is Finished",
+            ),
+            (
+                ParsedTaskData(
+                    name="Out of order history",
+                    estimate=3,
+                    description=None,
+                    status=Status.FINISHED,
+                    history=[
+                        ParsedTaskHistoryRecord(is_start=True, time=1633036805),
+                        ParsedTaskHistoryRecord(is_start=False, time=1633036800),
+                    ],
+                ),
+                "History must be in ascending order by time",
+            ),
+            (
+                ParsedTaskData(
+                    name="Stop and Start reversed",
+                    estimate=3,
+                    description=None,
+                    status=Status.FINISHED,
+                    history=[
+                        ParsedTaskHistoryRecord(is_start=True, time=1633036800),
+                        ParsedTaskHistoryRecord(is_start=True, time=1633036800),
+                        ParsedTaskHistoryRecord(is_start=False, time=1633036800),
+                        ParsedTaskHistoryRecord(is_start=False, time=1633036800),
+                    ],
+                ),
+                "History must alternate between Start and Stop",
+            ),
+        ]
+        # each case is reported on its own, one failure doesn't hide the rest
+        for task_data, message in invalid_task_data:
+            with self.subTest(task_data.name):
+                with self.assertRaises(ThunterTaskValidationError) as error:
+                    validate_task_data(task_data)
+                self.assertIn(message, str(error.exception))
+
+    def test_parse_time(self):
+        """Test parsing a displayed time."""
+        self.assertEqual(parse_time("2021-09-30 21:20:00"), 1633036800)
+        self.assertEqual(parse_time("1970-01-01 00:00:00"), 0)
+        with self.assertRaises(ValueError):
+            parse_time("2021-09-31 21:20:00")
+        with self.assertRaises(ValueError):
+            parse_time("2021-09-30")
+
+    def test_parse_missing_values(self):
+        """Test parsing a task without an estimate or description."""
+        parsed_data = parse_task_display(
+            "NAME: Test Task\n"
+            "ESTIMATE: None\n"
+            "STATUS: TODO\n"
+            "DESCRIPTION: None\n"
+            "\n"
+            "HISTORY\n"
         )
+        self.assertIsNone(parsed_data.estimate)
+        self.assertIsNone(parsed_data.description)
 
-        task_data = ParsedTaskData(
-            name="Stop and Start reversed",
-            estimate=3,
-            description=None,
-            status=Status.FINISHED,
-            history=[
-                ParsedTaskHistoryRecord(is_start=True, time=1633036800),
-                ParsedTaskHistoryRecord(is_start=True, time=1633036800),
-                ParsedTaskHistoryRecord(is_start=False, time=1633036800),
-                ParsedTaskHistoryRecord(is_start=False, time=1633036800),
-            ],
+        parsed_data = parse_task_display(
+            "NAME: Test Task\nESTIMATE: 1\nSTATUS: TODO\nDESCRIPTION: \nHISTORY\n"
         )
-        with self.assertRaises(ThunterTaskValidationError) as error:
-            validate_task_data(task_data)
-        self.assertIn(
-            "History must alternate between Start and Stop",
-            str(error.exception),
-        )
-
-    def test_parse_name(self):
-        """Test parsing a task name."""
-        name_display = "NAME: Test Task"
-        parsed_data = name.parse_string(name_display)
-        self.assertEqual(parsed_data.name, "Test Task")
-
-    def test_parse_estimate(self):
-        """Test parsing a task estimate."""
-        estimate_display = "ESTIMATE: 5"
-        parsed_data = estimate.parse_string(estimate_display)
-        self.assertEqual(parsed_data.estimate, 5)
-
-    def test_parse_status(self):
-        """Test parsing a task status."""
-        status_display = "STATUS: In Progress"
-        parsed_data = status.parse_string(status_display)
-        self.assertEqual(parsed_data.status, Status.IN_PROGRESS)
-
-    def test_parse_description(self):
-        """Test parsing a task description."""
-        description_display = "DESCRIPTION: This is a test task."
-        parsed_data = description.parse_string(description_display)
-        self.assertEqual(parsed_data.description, "This is a test task.")
-
-    def test_parse_empty_description(self):
-        """Test parsing a task description."""
-        description_display = "DESCRIPTION: "
-        parsed_data = description.parse_string(description_display)
         self.assertEqual(parsed_data.description, "")
 
-    def test_parse_history(self):
-        """Test parsing task history."""
-        history_display = (
-            "HISTORY\nStart\t2021-09-30 21:20:00\nStop\t2021-09-30 21:26:40\n"
+    def test_parse_invalid_task(self):
+        """Test parsing malformed task displays."""
+        valid_display = (
+            "NAME: Test Task\n"
+            "ESTIMATE: 4\n"
+            "STATUS: Finished\n"
+            "DESCRIPTION: This is a test task.\n"
+            "\n"
+            "HISTORY\n"
+            "Start\t2021-09-30 21:20:00\n"
+            "Stop\t2021-09-30 21:26:40\n"
         )
-        parsed_data = history.parse_string(history_display)
-        self.assertEqual(len(parsed_data.history), 2)
-        self.assertTrue(parsed_data.history[0].is_start)  # type: ignore
-        self.assertEqual(parsed_data.history[0].time, 1633036800)  # type: ignore
-        self.assertFalse(parsed_data.history[1].is_start)  # type: ignore
-        self.assertEqual(parsed_data.history[1].time, 1633037200)  # type: ignore
+        self.assertEqual(parse_task_display(valid_display).status, Status.FINISHED)
+
+        for invalid_display, message in [
+            (valid_display.replace("ESTIMATE: 4", "ESTIMATE: four"), "ESTIMATE"),
+            (valid_display.replace("Finished", "Done"), "STATUS"),
+            (valid_display.replace("NAME: Test Task", "NAME: "), "NAME"),
+            (valid_display.replace("HISTORY\n", ""), "HISTORY"),
+            (valid_display.replace("Stop\t", "Pause\t"), "Invalid history record"),
+            (valid_display.replace("21:26:40", "later"), "Invalid history record"),
+        ]:
+            with self.assertRaises(ThunterTaskValidationError) as error:
+                parse_task_display(invalid_display)
+            self.assertIn(message, str(error.exception))
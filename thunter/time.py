@@ -1,12 +1,11 @@
-from datetime import datetime
-from time import gmtime, strftime
+from time import gmtime, strftime, time
 
 from thunter.constants import TIME_FORMAT
 
 
 def now_sec() -> int:
     """Returns the current time as integer seconds since epoch."""
-    return int(datetime.now().timestamp())
+    return int(time())
 
 
 def display_time(seconds: int) -> str: